@@ -46,11 +46,15 @@ class AssignHotkey:
 
 @dataclass
 class AddSoundFromFile:
-    """Comando para agregar un sonido desde un archivo"""
+    """
+    Comando para agregar un sonido desde un archivo.
+    hotkey "" y volume None significan "sin especificar": un sonido nuevo
+    usa los valores por defecto y uno ya existente conserva los suyos.
+    """
     file_path: str
     category: str
     hotkey: str = ""
-    volume: float = 1.0
+    volume: Optional[float] = None
 
 
 @dataclass
@@ -0,0 +1,41 @@
+"""
+Events - Objetos que describen un cambio ya aplicado a un sonido
+Los emite el controller para que la UI actualice solo lo afectado
+"""
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class VolumeChanged:
+    """Cambió el volumen de un sonido"""
+    sound_id: str
+    volume: float
+
+
+@dataclass
+class LoopToggled:
+    """Se activó o desactivó el loop de un sonido"""
+    sound_id: str
+    loop: bool
+
+
+@dataclass
+class HotkeyAssigned:
+    """Se asignó un hotkey a un sonido"""
+    sound_id: str
+    hotkey: str
+
+
+@dataclass
+class ImageSet:
+    """Se estableció la imagen de un sonido"""
+    sound_id: str
+    image_path: Optional[str]
+
+
+@dataclass
+class SoundRenamed:
+    """Se renombró un sonido"""
+    sound_id: str
+    name: str
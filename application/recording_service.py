@@ -25,6 +25,7 @@ class RecordingService:
         self.config_repo = config_repo
         self._current_category: Optional[str] = None
         self._current_recording_id: Optional[str] = None
+        self._current_output_path: Optional[Path] = None
     
     def start_recording(self, category: str, device_id: Optional[int] = None) -> str:
         """
@@ -40,11 +41,16 @@ class RecordingService:
         if self.is_recording():
             raise RuntimeError("Already recording")
         
+        # Generar nombre de archivo: el motor escribe a disco mientras graba
+        filename = f"rec_{uuid.uuid4().hex}.wav"
+        output_path = self.config_repo.get_sound_path(category, filename)
+        
         self._current_category = category
         self._current_recording_id = str(uuid.uuid4())
+        self._current_output_path = output_path
         
         # Iniciar grabación en el motor
-        self.audio_engine.start_recording(device_id=device_id)
+        self.audio_engine.start_recording(str(output_path), device_id=device_id)
         
         return self._current_recording_id
     
@@ -58,19 +64,12 @@ class RecordingService:
         if not self.is_recording():
             raise RuntimeError("No recording active")
         
-        # Generar nombre de archivo
-        filename = f"rec_{uuid.uuid4().hex}.wav"
-        output_path = self.config_repo.get_sound_path(
-            self._current_category,
-            filename
-        )
-        
-        # Detener y guardar
-        self.audio_engine.stop_recording(str(output_path))
+        # Detener y cerrar el archivo
+        self.audio_engine.stop_recording()
         
         # Crear entidad Sound
         sound = Sound(
-            file_path=str(output_path),
+            file_path=str(self._current_output_path),
             category=self._current_category,
             name=f"Recording {self._current_recording_id[:8]}"
         )
@@ -78,6 +77,7 @@ class RecordingService:
         # Limpiar estado
         self._current_category = None
         self._current_recording_id = None
+        self._current_output_path = None
         
         return sound
     
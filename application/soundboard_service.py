@@ -2,9 +2,12 @@
 Servicio principal del Soundboard - Application Layer
 Interpreta comandos y coordina dominio + audio + persistencia.
 """
-from typing import Optional, List
+from typing import Dict, Optional, List
+import filecmp
+import logging
 import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from pulseboard.domain.soundboard import Soundboard
@@ -17,6 +20,9 @@ from pulseboard.persistence.config_repository import ConfigRepository
 from . import commands
 
 
+log = logging.getLogger(__name__)
+
+
 class SoundboardService:
     """
     Servicio de aplicación que coordina todas las operaciones del soundboard.
@@ -33,21 +39,50 @@ class SoundboardService:
         self.audio_engine = audio_engine
         self.config_repo = config_repo
         
+        # Huellas de contenido -> sound_id (se indexan en el primer alta)
+        self._fingerprints: Dict[bytes, str] = {}
+        self._fingerprints_indexed = False
+        
+        # Pool de apply_effect_batch / trim_batch (se crea al primer uso)
+        self._batch_pool: Optional[ThreadPoolExecutor] = None
+        
+        # Resultados de efectos ya calculados:
+        # (ruta, tamaño, mtime origen, efecto, parámetros) -> (ruta salida, firma salida)
+        self._effect_results: Dict[tuple, tuple] = {}
+        
         # Mapeo de efectos disponibles
         self._effect_factory = {
-            'pitch_high': lambda: PitchEffect(1.5),
-            'pitch_low': lambda: PitchEffect(0.7),
-            'slowed': lambda: SlowedEffect(),
-            'fast': lambda: FastEffect(),
+            'pitch_high': lambda params: PitchEffect(1.5),
+            'pitch_low': lambda params: PitchEffect(0.7),
+            'slowed': lambda params: SlowedEffect(),
+            'fast': lambda params: FastEffect(),
             'speed': lambda params: SpeedEffect(params.get('factor', 1.0))
         }
+        
+        # Tabla comando -> handler, resuelta una sola vez
+        self._handlers = {
+            commands.PlaySound: self._handle_PlaySound,
+            commands.StopSound: self._handle_StopSound,
+            commands.StopAllSounds: self._handle_StopAllSounds,
+            commands.SetVolume: self._handle_SetVolume,
+            commands.ToggleLoop: self._handle_ToggleLoop,
+            commands.AssignHotkey: self._handle_AssignHotkey,
+            commands.AddSoundFromFile: self._handle_AddSoundFromFile,
+            commands.DeleteSound: self._handle_DeleteSound,
+            commands.SetSoundImage: self._handle_SetSoundImage,
+            commands.RenameSound: self._handle_RenameSound,
+            commands.MoveSoundToCategory: self._handle_MoveSoundToCategory,
+            commands.CreateCategory: self._handle_CreateCategory,
+            commands.DeleteCategory: self._handle_DeleteCategory,
+            commands.ApplyEffect: self._handle_ApplyEffect,
+            commands.TrimSound: self._handle_TrimSound,
+        }
     
     def handle(self, command):
         """
         Despacha un comando al handler apropiado.
         """
-        handler_name = f"_handle_{command.__class__.__name__}"
-        handler = getattr(self, handler_name, None)
+        handler = self._handlers.get(type(command))
         
         if handler is None:
             raise ValueError(f"No handler for command {command.__class__.__name__}")
@@ -97,6 +132,10 @@ class SoundboardService:
         # 2. Reiniciar reproducción en loop
         self.audio_engine.stop(sound.id)
 
+        # Cargar si no está cargado (nunca reproducido, desalojado del LRU
+        # o descargado tras un efecto/recorte)
+        self.audio_engine.load_sound(sound.id, sound.file_path)
+
         self.audio_engine.play(
             sound.id,
             volume=sound.volume,
@@ -113,22 +152,38 @@ class SoundboardService:
     
     def _handle_AddSoundFromFile(self, cmd: commands.AddSoundFromFile):
         """Agrega un sonido desde un archivo"""
+        # Detectar contenido ya presente en la biblioteca
+        fingerprint = self.config_repo.fingerprint(cmd.file_path)
+        duplicate = self._find_duplicate(fingerprint, cmd.file_path)
+        if duplicate and duplicate.category == cmd.category:
+            # Mismo archivo en la misma categoría: se reutiliza el sonido
+            # existente con la configuración pedida
+            if cmd.volume is not None:
+                duplicate.set_volume(cmd.volume)
+            if cmd.hotkey:
+                self.soundboard.update_sound_hotkey(duplicate.id, cmd.hotkey)
+            self._save_config()
+            return duplicate.id
+        
         # Copiar archivo a la carpeta de la categoría
+        # (si es un duplicado, se enlaza el archivo que ya está en la biblioteca)
         dest_path = self.config_repo.copy_sound_to_category(
-            cmd.file_path,
+            duplicate.file_path if duplicate else cmd.file_path,
             cmd.category
         )
         
         # Crear entidad Sound
         sound = Sound(
+            name=Path(cmd.file_path).stem,
             file_path=str(dest_path),
             category=cmd.category,
-            volume=cmd.volume,
+            volume=1.0 if cmd.volume is None else cmd.volume,
             hotkey=cmd.hotkey
         )
         
         # Agregar al soundboard
         self.soundboard.add_sound(sound)
+        self._fingerprints[fingerprint] = sound.id
         
         # Cargar en el motor de audio
         self.audio_engine.load_sound(sound.id, sound.file_path)
@@ -143,20 +198,7 @@ class SoundboardService:
         if not sound:
             return
         
-        # Detener si está sonando
-        self.audio_engine.stop(cmd.sound_id)
-        
-        # Descargar del motor
-        self.audio_engine.unload_sound(cmd.sound_id)
-        
-        # Eliminar archivo si se solicita
-        if cmd.delete_file:
-            self.config_repo.delete_sound_file(sound.file_path)
-            if sound.image_path:
-                self.config_repo.delete_image_file(sound.image_path)
-        
-        # Remover del dominio
-        self.soundboard.remove_sound(cmd.sound_id)
+        self._delete_sounds_bulk([sound], delete_file=cmd.delete_file)
         
         self._save_config()
     
@@ -182,7 +224,7 @@ class SoundboardService:
         if not sound:
             raise ValueError(f"Sound {cmd.sound_id} not found")
         
-        sound.name = cmd.new_name
+        sound.rename(cmd.new_name)
         self._save_config()
     
     def _handle_MoveSoundToCategory(self, cmd: commands.MoveSoundToCategory):
@@ -198,13 +240,12 @@ class SoundboardService:
             old_path.name
         )
         
-        import shutil
-        shutil.move(str(old_path), str(new_path))
+        self.config_repo.move_sound_file(str(old_path), new_path)
         
         # Actualizar en dominio
         self.soundboard.remove_sound(cmd.sound_id)
-        sound.file_path = str(new_path)
-        sound.category = cmd.target_category
+        sound.set_file_path(str(new_path))
+        sound.set_category(cmd.target_category)
         self.soundboard.add_sound(sound)
         
         self._save_config()
@@ -226,14 +267,14 @@ class SoundboardService:
         # Obtener sonidos de la categoría
         sounds = self.soundboard.get_sounds_by_category(cmd.name)
         
-        # Eliminar cada sonido
-        for sound in sounds:
-            self.handle(commands.DeleteSound(sound.id, delete_file=True))
+        # Eliminar todos los sonidos en una pasada, con un solo guardado
+        self._delete_sounds_bulk(sounds, delete_file=True)
         
         # Eliminar categoría del dominio
         self.soundboard.delete_category(cmd.name)
         
         self._save_config()
+        self.flush()
     
     # ==================== EFFECTS ====================
     
@@ -244,29 +285,27 @@ class SoundboardService:
             raise ValueError(f"Sound {cmd.sound_id} not found")
         
         # Obtener efecto
-        if cmd.effect_name not in self._effect_factory:
-            raise ValueError(f"Unknown effect: {cmd.effect_name}")
-        
-        effect_instance = self._effect_factory[cmd.effect_name]()
-        if callable(self._effect_factory[cmd.effect_name]):
-            effect_instance = self._effect_factory[cmd.effect_name](cmd.parameters)
+        effect_instance = self._create_effect(cmd.effect_name, cmd.parameters)
         
         # Generar archivo de salida
         output_path = self._get_effect_output_path(sound, cmd.effect_name)
         
-        # Aplicar efecto
-        self.audio_engine.apply_effects_to_file(
-            sound.file_path,
-            str(output_path),
-            [effect_instance]
-        )
+        # Aplicar efecto (o reutilizar el resultado de ese mismo audio)
+        result_key = self._effect_result_key(sound.file_path, cmd.effect_name, cmd.parameters)
+        if not self._reuse_effect_result(result_key, output_path):
+            self.audio_engine.apply_effects_to_file(
+                sound.file_path,
+                str(output_path),
+                [effect_instance]
+            )
+            self._remember_effect_result(result_key, output_path)
         
         # Actualizar sound para usar el nuevo archivo
-        sound.file_path = str(output_path)
+        sound.set_file_path(str(output_path))
         sound.add_effect(cmd.effect_name)
         
-        # Recargar en el motor
-        self.audio_engine.load_sound(sound.id, sound.file_path)
+        # Descartar el audio viejo; PlaySound carga el archivo nuevo al reproducir
+        self.audio_engine.unload_sound(sound.id)
         
         self._save_config()
     
@@ -288,31 +327,276 @@ class SoundboardService:
         )
         
         # Actualizar sound
-        sound.file_path = str(output_path)
+        sound.set_file_path(str(output_path))
         
-        # Recargar
-        self.audio_engine.load_sound(sound.id, sound.file_path)
+        # Descartar el audio viejo; PlaySound carga el archivo nuevo al reproducir
+        self.audio_engine.unload_sound(sound.id)
+        
+        self._save_config()
+    
+    # ==================== BATCH ====================
+    
+    def apply_effect_batch(
+        self, sound_ids: List[str], effect_name: str, parameters: dict
+    ) -> Dict[str, Exception]:
+        """
+        Aplica un efecto a varios sonidos en paralelo.
+        Solo el procesamiento de archivos corre en hilos; el dominio y la
+        caché de resultados se actualizan en el hilo que llama, con un
+        único guardado. Un sonido que falla conserva su archivo original.
+        
+        Returns:
+            sound_id -> excepción de los sonidos que no se pudieron procesar
+        """
+        jobs = []
+        for sound_id in sound_ids:
+            sound = self.soundboard.get_sound(sound_id)
+            if not sound:
+                raise ValueError(f"Sound {sound_id} not found")
+            
+            output_path = self._get_effect_output_path(sound, effect_name)
+            result_key = self._effect_result_key(sound.file_path, effect_name, parameters)
+            jobs.append((sound, output_path, result_key))
+        
+        # Los ya calculados se copian; el resto va al pool
+        # (libsndfile y numpy liberan el GIL: los archivos se procesan en paralelo)
+        pool = self._get_batch_pool()
+        futures = {}
+        for sound, output_path, result_key in jobs:
+            if not self._reuse_effect_result(result_key, output_path):
+                futures[sound.id] = pool.submit(
+                    self.audio_engine.apply_effects_to_file,
+                    sound.file_path,
+                    str(output_path),
+                    [self._create_effect(effect_name, parameters)]
+                )
+        
+        failures = self._collect_batch(jobs, futures, f"apply {effect_name}")
+        
+        for sound, output_path, result_key in jobs:
+            if sound.id in failures:
+                continue
+            if sound.id in futures:
+                self._remember_effect_result(result_key, output_path)
+            sound.set_file_path(str(output_path))
+            sound.add_effect(effect_name)
+            self.audio_engine.unload_sound(sound.id)
+        
+        self._save_config()
+        return failures
+    
+    def trim_batch(
+        self, sound_ids: List[str], start_time: float, end_time: float
+    ) -> Dict[str, Exception]:
+        """
+        Recorta varios sonidos en paralelo con el mismo rango.
+        Un sonido que falla conserva su archivo original.
+        
+        Returns:
+            sound_id -> excepción de los sonidos que no se pudieron recortar
+        """
+        jobs = []
+        for sound_id in sound_ids:
+            sound = self.soundboard.get_sound(sound_id)
+            if not sound:
+                raise ValueError(f"Sound {sound_id} not found")
+            
+            jobs.append((sound, self._get_trimmed_output_path(sound), None))
+        
+        pool = self._get_batch_pool()
+        futures = {
+            sound.id: pool.submit(
+                AudioTrimmer.trim,
+                sound.file_path,
+                str(output_path),
+                start_time,
+                end_time
+            )
+            for sound, output_path, _ in jobs
+        }
+        
+        failures = self._collect_batch(jobs, futures, "trim")
+        
+        for sound, output_path, _ in jobs:
+            if sound.id in failures:
+                continue
+            sound.set_file_path(str(output_path))
+            self.audio_engine.unload_sound(sound.id)
         
         self._save_config()
+        return failures
+    
+    def _get_batch_pool(self) -> ThreadPoolExecutor:
+        """Pool de los procesos en lote; se crea al primer uso y se reutiliza"""
+        if self._batch_pool is None:
+            self._batch_pool = ThreadPoolExecutor(
+                max_workers=os.cpu_count(),
+                thread_name_prefix="pulseboard-batch"
+            )
+        return self._batch_pool
+    
+    def _collect_batch(self, jobs: list, futures: dict, action: str) -> Dict[str, Exception]:
+        """
+        Espera todos los trabajos de un lote (no se corta en el primer
+        error) y borra la salida a medio escribir de los que fallaron.
+        """
+        failures = {}
+        for sound, output_path, _ in jobs:
+            future = futures.get(sound.id)
+            if future is None:
+                continue
+            try:
+                future.result()
+            except Exception as e:
+                log.warning("Batch %s failed for %s: %s", action, sound.file_path, e)
+                failures[sound.id] = e
+                if Path(sound.file_path) != output_path:
+                    self.config_repo.delete_sound_file(str(output_path))
+        return failures
     
     # ==================== HELPERS ====================
     
+    def _create_effect(self, effect_name: str, parameters: dict):
+        """Crea una instancia nueva del efecto pedido"""
+        if effect_name not in self._effect_factory:
+            raise ValueError(f"Unknown effect: {effect_name}")
+        
+        return self._effect_factory[effect_name](parameters)
+    
+    @staticmethod
+    def _file_signature(file_path: str) -> tuple:
+        """(tamaño, mtime en ns): cambia si el archivo se reescribe"""
+        stat = os.stat(file_path)
+        return stat.st_size, stat.st_mtime_ns
+    
+    def _effect_result_key(self, file_path: str, effect_name: str, parameters: dict) -> tuple:
+        """
+        Clave de un resultado de efecto: archivo de origen (ruta + firma) y
+        efecto. No usa fingerprint(): solo muestrea el inicio y el final, y
+        dos tomas distintas con los extremos en silencio compartirían salida.
+        """
+        return (
+            os.path.abspath(file_path),
+            *self._file_signature(file_path),
+            effect_name,
+            tuple(sorted(parameters.items()))
+        )
+    
+    def _reuse_effect_result(self, result_key: tuple, output_path: Path) -> bool:
+        """
+        Si ese efecto ya se calculó sobre el mismo audio y el archivo sigue
+        intacto, lo copia a output_path en vez de procesar de nuevo.
+        """
+        cached = self._effect_results.get(result_key)
+        if cached is None:
+            return False
+        
+        cached_path, cached_signature = cached
+        try:
+            if self._file_signature(cached_path) != cached_signature:
+                del self._effect_results[result_key]
+                return False
+            
+            if Path(cached_path) != output_path:
+                self.config_repo.duplicate_sound_file(cached_path, output_path)
+        except OSError:
+            del self._effect_results[result_key]
+            return False
+        
+        return True
+    
+    def _remember_effect_result(self, result_key: tuple, output_path: Path):
+        """Registra el archivo resultante de un efecto"""
+        self._effect_results[result_key] = (
+            str(output_path),
+            self._file_signature(str(output_path))
+        )
+    
+    def _delete_sounds_bulk(self, sounds: List[Sound], delete_file: bool = True):
+        """
+        Elimina varios sonidos del motor, del disco y del dominio.
+        No guarda: el llamador guarda una sola vez al final.
+        """
+        for sound in sounds:
+            # Descargar del motor (detiene si está sonando)
+            self.audio_engine.unload_sound(sound.id)
+            
+            # Eliminar archivo si se solicita
+            if delete_file:
+                self.config_repo.delete_sound_file(sound.file_path)
+                if sound.image_path:
+                    self.config_repo.delete_image_file(sound.image_path)
+            
+            # Remover del dominio
+            self.soundboard.remove_sound(sound.id)
+    
     def _save_config(self):
-        """Guarda la configuración actual"""
-        data = self.soundboard.to_dict()
-        self.config_repo.save(data)
+        """
+        Programa un guardado de la configuración.
+        La instantánea se toma aquí, en el hilo de la UI; el repositorio
+        agrupa las llamadas seguidas y el timer solo escribe los datos.
+        """
+        self.config_repo.schedule_save(self._config_data())
+    
+    def flush(self, final: bool = False):
+        """
+        Escribe ya la configuración si hay cambios pendientes.
+        Con final=True (al cerrar) cancela el guardado diferido y los
+        cambios posteriores se escriben en el momento, sin timer; también
+        libera el pool de los procesos en lote.
+        """
+        if final:
+            if self._batch_pool is not None:
+                self._batch_pool.shutdown(wait=True)
+                self._batch_pool = None
+            self.config_repo.close()
+        else:
+            self.config_repo.flush()
+    
+    def _config_data(self) -> dict:
+        """Estado actual a persistir (el soundboard puede reemplazarse al cargar)"""
+        return self.soundboard.snapshot()
     
     def load_config(self):
         """Carga la configuración guardada"""
-        data = self.config_repo.load()
-        if data:
-            loaded_board = Soundboard.from_dict(data)
+        if self.config_repo.has_saved_state():
+            # Se construye shard por shard: nunca está todo el JSON en memoria
+            loaded_board = Soundboard.from_shards(self.config_repo.load_streaming())
             self.soundboard = loaded_board
+            self._fingerprints.clear()
+            self._fingerprints_indexed = False
             
-            # Cargar todos los sonidos en el motor de audio
+            # Los sonidos se cargan en el motor al reproducirse por primera vez
+    
+    def _find_duplicate(self, fingerprint: bytes, file_path: str) -> Optional[Sound]:
+        """
+        Busca un sonido existente con el mismo contenido que file_path.
+        La huella solo muestrea el archivo: una coincidencia se confirma
+        comparando byte a byte antes de darla por duplicado.
+        """
+        if not self._fingerprints_indexed:
             for sound in self.soundboard.get_all_sounds():
-                if os.path.exists(sound.file_path):
-                    self.audio_engine.load_sound(sound.id, sound.file_path)
+                try:
+                    self._fingerprints[self.config_repo.fingerprint(sound.file_path)] = sound.id
+                except OSError:
+                    continue
+            self._fingerprints_indexed = True
+        
+        sound = self.soundboard.get_sound(self._fingerprints.get(fingerprint, ""))
+        if not sound:
+            return None
+        
+        # El archivo pudo cambiar (efecto, recorte) desde que se indexó,
+        # y dos archivos distintos pueden compartir huella
+        try:
+            if self.config_repo.fingerprint(sound.file_path) != fingerprint:
+                return None
+            if not filecmp.cmp(file_path, sound.file_path, shallow=False):
+                return None
+        except OSError:
+            return None
+        
+        return sound
     
     def _get_effect_output_path(self, sound: Sound, effect_name: str) -> Path:
         """Genera ruta para archivo con efecto aplicado"""
@@ -2,6 +2,9 @@
 Motor de audio - Infraestructura de reproducción y grabación
 Maneja pygame, sounddevice y aplicación de efectos.
 """
+import logging
+import threading
+from collections import OrderedDict
 import pygame
 import sounddevice as sd
 import soundfile as sf
@@ -9,23 +12,59 @@ import numpy as np
 from typing import Optional, Callable, List
 from pathlib import Path
 
+from pulseboard.audio.effects.base_effect import AudioEffect
+
+
+log = logging.getLogger(__name__)
+
 
 class AudioEngine:
+    RECORDING_SAMPLERATE = 44100
+    RECORDING_CHANNELS = 1
+    RECORDING_SUBTYPE = 'PCM_16'  # la mitad de bytes que FLOAT, sin pérdida audible
+    RECORDING_BLOCK_SIZE = 1024   # frames por callback
+    RECORDING_SLOTS = 256         # bloques en el ring (~6 s a 44.1 kHz)
+    MAX_CACHED_SOUNDS = 64        # sonidos decodificados en memoria (LRU)
+
     def __init__(self):
         pygame.mixer.init()
-        self._sounds = {}     # sound_id -> pygame.mixer.Sound
+        self._sounds = OrderedDict()  # sound_id -> pygame.mixer.Sound (orden LRU)
         self._channels = {}   # sound_id -> pygame.mixer.Channel
 
+        # Estado de grabación
+        self._rec_stream = None
+        self._rec_file = None     # sf.SoundFile abierto durante la grabación
+        self._rec_writer = None   # hilo consumidor que vuelca el ring al archivo
+        self._rec_active = False
+
+        # Ring SPSC preasignado: el callback produce, el escritor consume
+        self._rec_slots = np.empty(
+            (self.RECORDING_SLOTS, self.RECORDING_BLOCK_SIZE, self.RECORDING_CHANNELS),
+            dtype=np.float32
+        )
+        self._rec_slot_frames = np.zeros(self.RECORDING_SLOTS, dtype=np.int64)
+        self._rec_wr = 0          # solo lo avanza el callback
+        self._rec_rd = 0          # solo lo avanza el escritor
+        self._rec_dropped = 0     # bloques perdidos por ring lleno
+        self._rec_status_count = 0  # callbacks con status de PortAudio (over/underflow)
+        self._rec_last_status = None
+        self._rec_ready = threading.Event()  # el callback avisa al escritor
+
     # ================= Playback =================
 
     def load_sound(self, sound_id: str, file_path: str) -> None:
-        if sound_id not in self._sounds:
-            self._sounds[sound_id] = pygame.mixer.Sound(file_path)
+        if sound_id in self._sounds:
+            self._sounds.move_to_end(sound_id)
+            return
+
+        self._sounds[sound_id] = pygame.mixer.Sound(file_path)
+        self._evict_unused()
 
     def play(self, sound_id: str, volume: float, loop: bool) -> None:
         if sound_id not in self._sounds:
             raise ValueError(f"Sound {sound_id} not loaded")
 
+        self._sounds.move_to_end(sound_id)
         sound = self._sounds[sound_id]
         sound.set_volume(volume)
 
@@ -42,8 +81,8 @@ class AudioEngine:
             del self._channels[sound_id]
 
     def stop_all(self) -> None:
-        for channel in self._channels.values():
-            channel.stop()
+        # Una sola llamada a SDL en lugar de detener canal por canal
+        pygame.mixer.stop()
         self._channels.clear()
 
     def is_playing(self, sound_id: str) -> bool:
@@ -54,8 +93,160 @@ class AudioEngine:
         self.stop(sound_id)
         self._sounds.pop(sound_id, None)
 
+    def _evict_unused(self) -> None:
+        # Descarga los menos usados recientemente, salvo los que están sonando
+        excess = len(self._sounds) - self.MAX_CACHED_SOUNDS
+        if excess <= 0:
+            return
+
+        for sound_id in list(self._sounds):
+            if excess <= 0:
+                break
+            if self.is_playing(sound_id):
+                continue
+            self.unload_sound(sound_id)
+            excess -= 1
+
+    # ================= Recording =================
+
+    def start_recording(
+        self,
+        output_path: str,
+        device_id: Optional[int] = None,
+        subtype: Optional[str] = None
+    ) -> None:
+        if self.is_recording():
+            raise RuntimeError("Already recording")
+
+        self._rec_file = sf.SoundFile(
+            output_path,
+            mode='w',
+            samplerate=self.RECORDING_SAMPLERATE,
+            channels=self.RECORDING_CHANNELS,
+            subtype=subtype or self.RECORDING_SUBTYPE
+        )
+        self._rec_wr = 0
+        self._rec_rd = 0
+        self._rec_dropped = 0
+        self._rec_status_count = 0
+        self._rec_last_status = None
+        self._rec_ready.clear()
+        self._rec_active = True
+        self._rec_writer = threading.Thread(target=self._drain_recording, daemon=True)
+        self._rec_writer.start()
+
+        slots = self._rec_slots
+        slot_frames = self._rec_slot_frames
+        n_slots = self.RECORDING_SLOTS
+
+        ready = self._rec_ready
+
+        # Corre en el hilo de audio: una copia a un slot fijo y avanzar el índice
+        def callback(indata, frames, time_info, status):
+            if status:
+                self._rec_status_count += 1
+                self._rec_last_status = status
+            wr = self._rec_wr
+            if wr - self._rec_rd >= n_slots:
+                self._rec_dropped += 1
+                return
+            slot = wr % n_slots
+            slots[slot, :frames] = indata
+            slot_frames[slot] = frames
+            self._rec_wr = wr + 1
+            ready.set()
+
+        self._rec_stream = sd.InputStream(
+            samplerate=self.RECORDING_SAMPLERATE,
+            channels=self.RECORDING_CHANNELS,
+            dtype='float32',
+            blocksize=self.RECORDING_BLOCK_SIZE,
+            device=device_id,
+            callback=callback
+        )
+        self._rec_stream.start()
+
+    def stop_recording(self) -> str:
+        if not self.is_recording():
+            raise RuntimeError("No recording active")
+
+        self._rec_stream.stop()
+        self._rec_stream.close()
+        self._rec_stream = None
+
+        # Fin de stream: el escritor vacía lo pendiente y termina
+        self._rec_active = False
+        self._rec_ready.set()
+        self._rec_writer.join()
+        self._rec_writer = None
+
+        if self._rec_dropped:
+            log.warning(
+                "Recording dropped %d blocks (writer fell behind)", self._rec_dropped
+            )
+        if self._rec_status_count:
+            log.warning(
+                "Recording had %d audio callbacks with status %s",
+                self._rec_status_count, self._rec_last_status
+            )
+
+        output_path = self._rec_file.name
+        self._rec_file.close()
+        self._rec_file = None
+        return output_path
+
+    def _drain_recording(self) -> None:
+        while True:
+            # Se limpia antes de leer _rec_wr: un bloque que llegue después
+            # vuelve a activar el evento y no se pierde
+            self._rec_ready.wait()
+            self._rec_ready.clear()
+            active = self._rec_active
+            wr = self._rec_wr
+            while self._rec_rd < wr:
+                slot = self._rec_rd % self.RECORDING_SLOTS
+                self._rec_file.write(self._rec_slots[slot, :self._rec_slot_frames[slot]])
+                self._rec_rd += 1
+            if not active:
+                break
+
+    def is_recording(self) -> bool:
+        return self._rec_stream is not None
+
+    def get_available_input_devices(self) -> List[dict]:
+        return [
+            {"id": index, "name": device["name"]}
+            for index, device in enumerate(sd.query_devices())
+            if device["max_input_channels"] > 0
+        ]
+
+    # ================= Effects =================
+
+    def apply_effects_to_file(
+        self,
+        input_path: str,
+        output_path: str,
+        effects: List[AudioEffect]
+    ) -> str:
+        """
+        Aplica la cadena de efectos a un archivo y escribe el resultado,
+        conservando el subtipo (PCM_16, FLOAT...) del original.
+        """
+        with sf.SoundFile(input_path) as src:
+            samplerate = src.samplerate
+            subtype = src.subtype
+            samples = src.read(dtype='float32')
+
+        for effect in effects:
+            samples = effect(samples, samplerate)
+        sf.write(output_path, samples, samplerate, subtype=subtype)
+        return output_path
+
     # ================= Cleanup =================
 
     def cleanup(self) -> None:
+        if self.is_recording():
+            self._rec_stream.abort()
+            self.stop_recording()
         self.stop_all()
         pygame.mixer.quit()
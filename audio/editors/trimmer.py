@@ -2,17 +2,32 @@
 Trimmer - Recorte de audio
 Operación destructiva que genera un nuevo archivo.
 """
+import os
+import struct
+import sys
+from functools import lru_cache
 import soundfile as sf
 import numpy as np
 from pathlib import Path
 
 
+@lru_cache(maxsize=1024)
+def _info_cached(file_path: str, mtime_ns: int, size: int):
+    """
+    sf.info memoizado. mtime y tamaño en la clave: un archivo reescrito
+    nunca devuelve metadata vieja, así que no hace falta vaciar la caché.
+    """
+    return sf.info(file_path)
+
+
 class AudioTrimmer:
     """
     Recorta archivos de audio generando nuevos archivos.
     No modifica el original.
     """
     
+    BLOCK_SIZE = 1 << 16  # frames por bloque al copiar
+    
     @staticmethod
     def trim(
         input_path: str,
@@ -39,46 +54,162 @@ class AudioTrimmer:
         if end_time <= start_time:
             raise ValueError("end_time must be greater than start_time")
         
-        # Leer archivo
-        data, samplerate = sf.read(input_path)
+        # Validar contra el header antes de abrir o leer audio
+        info = AudioTrimmer._info(input_path)
+        start_sample = int(start_time * info.samplerate)
+        end_sample = int(end_time * info.samplerate)
         
-        # Convertir tiempos a samples
-        start_sample = int(start_time * samplerate)
-        end_sample = int(end_time * samplerate)
-        
-        # Validar rangos
-        total_samples = len(data)
+        total_samples = info.frames
         if start_sample >= total_samples:
             raise ValueError(f"start_time ({start_time}s) exceeds audio duration")
         
         end_sample = min(end_sample, total_samples)
         
-        # Recortar
-        trimmed = data[start_sample:end_sample]
+        # WAV PCM: copia directa de bytes, sin decodificar
+        if AudioTrimmer._trim_pcm_wav_fast(input_path, output_path, start_sample, end_sample):
+            return output_path
         
-        # Guardar
-        sf.write(output_path, trimmed, samplerate)
+        with sf.SoundFile(input_path) as src:
+            # Recortar por bloques: solo se lee la región pedida
+            src.seek(start_sample)
+            with sf.SoundFile(
+                output_path,
+                mode='w',
+                samplerate=src.samplerate,
+                channels=src.channels,
+                subtype=src.subtype
+            ) as dst:
+                for block in src.blocks(
+                    blocksize=AudioTrimmer.BLOCK_SIZE,
+                    frames=end_sample - start_sample,
+                    dtype='float32',
+                    always_2d=True
+                ):
+                    dst.write(block)
         
         return output_path
     
+    @staticmethod
+    def _trim_pcm_wav_fast(
+        input_path: str,
+        output_path: str,
+        start_sample: int,
+        end_sample: int
+    ) -> bool:
+        """
+        Recorta un WAV PCM copiando el rango de bytes del chunk 'data'.
+        Recibe el rango ya validado, en frames.
+        
+        Returns:
+            False si el archivo no es WAV PCM (usar el camino de libsndfile)
+        """
+        with open(input_path, 'rb') as src:
+            riff = src.read(12)
+            if len(riff) < 12 or riff[:4] != b'RIFF' or riff[8:12] != b'WAVE':
+                return False
+            
+            # Recorrer chunks hasta encontrar 'fmt ' y 'data'
+            fmt = None
+            data_offset = None
+            data_size = 0
+            while True:
+                header = src.read(8)
+                if len(header) < 8:
+                    break
+                chunk_id, chunk_size = struct.unpack('<4sI', header)
+                if chunk_id == b'fmt ':
+                    fmt = src.read(chunk_size)
+                    src.seek(chunk_size & 1, os.SEEK_CUR)
+                elif chunk_id == b'data':
+                    data_offset = src.tell()
+                    data_size = chunk_size
+                    break
+                else:
+                    src.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+            
+            if fmt is None or len(fmt) < 16 or data_offset is None:
+                return False
+            
+            audio_format, _, _, _, block_align, _ = struct.unpack(
+                '<HHIIHH', fmt[:16]
+            )
+            if audio_format != 1 or block_align == 0:  # 1 = WAVE_FORMAT_PCM
+                return False
+            
+            # El tamaño declarado puede ser incorrecto en archivos truncados
+            data_size = min(data_size, os.path.getsize(input_path) - data_offset)
+            end_sample = min(end_sample, data_size // block_align)
+            if start_sample >= end_sample:
+                return False
+            
+            # Nuevo header con los tamaños actualizados
+            payload = (end_sample - start_sample) * block_align
+            fmt_chunk = struct.pack('<4sI', b'fmt ', len(fmt)) + fmt + b'\0' * (len(fmt) & 1)
+            riff_size = 4 + len(fmt_chunk) + 8 + payload + (payload & 1)
+            
+            with open(output_path, 'wb', buffering=0) as dst:
+                dst.write(
+                    b'RIFF' + struct.pack('<I', riff_size) + b'WAVE'
+                    + fmt_chunk
+                    + struct.pack('<4sI', b'data', payload)
+                )
+                AudioTrimmer._copy_range(
+                    src, dst, data_offset + start_sample * block_align, payload
+                )
+                if payload & 1:
+                    dst.write(b'\0')
+        
+        return True
+    
+    @staticmethod
+    def _copy_range(src, dst, offset: int, length: int) -> None:
+        """Copia length bytes de src (desde offset) a la posición actual de dst"""
+        if sys.platform.startswith('linux'):
+            # Copia en el kernel, sin pasar por buffers de Python.
+            # (sendfile en macOS/BSD solo escribe a sockets)
+            try:
+                while length > 0:
+                    sent = os.sendfile(dst.fileno(), src.fileno(), offset, length)
+                    if sent == 0:
+                        return
+                    offset += sent
+                    length -= sent
+                return
+            except OSError:
+                pass  # Sin sendfile para estos archivos: se sigue desde donde quedó
+        
+        src.seek(offset)
+        buffer = memoryview(bytearray(min(length, 1 << 20)))
+        while length > 0:
+            read = src.readinto(buffer[:min(length, len(buffer))])
+            if not read:
+                break
+            dst.write(buffer[:read])
+            length -= read
+    
     @staticmethod
     def get_duration(file_path: str) -> float:
         """
         Obtiene la duración de un archivo de audio en segundos.
         """
-        info = sf.info(file_path)
-        return info.duration
+        return AudioTrimmer._info(file_path).duration
     
     @staticmethod
     def get_info(file_path: str) -> dict:
         """
         Obtiene información detallada de un archivo de audio.
         """
-        info = sf.info(file_path)
+        info = AudioTrimmer._info(file_path)
         return {
             'duration': info.duration,
             'samplerate': info.samplerate,
             'channels': info.channels,
             'format': info.format,
             'subtype': info.subtype
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def _info(file_path: str):
+        """Lee el header del archivo, reutilizando lecturas previas"""
+        stat = os.stat(file_path)
+        return _info_cached(file_path, stat.st_mtime_ns, stat.st_size)
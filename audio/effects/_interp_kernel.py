@@ -0,0 +1,39 @@
+"""
+Kernel de interpolación lineal compilado con Numba (opcional).
+Calcula posición, índices y mezcla de cada muestra en una sola pasada,
+en paralelo. Si Numba no está instalado, available() devuelve False y
+los efectos usan su camino numpy.
+
+Numba se importa (y el kernel se compila) la primera vez que se pide;
+el kernel vive en _interp_numba, que solo se importa si Numba existe.
+"""
+from functools import lru_cache
+import numpy as np
+
+
+@lru_cache(maxsize=1)
+def _kernel():
+    """Importa (y compila al primer uso) el kernel; None si Numba no está disponible"""
+    try:
+        from pulseboard.audio.effects import _interp_numba
+    except ImportError:
+        return None
+
+    return _interp_numba.fused_interp
+
+
+def available() -> bool:
+    """True si el kernel Numba puede usarse"""
+    return _kernel() is not None
+
+
+def interpolate_to_length(resampled: np.ndarray, length: int) -> np.ndarray:
+    """
+    Interpolación lineal de resampled (mono o stereo) a length frames.
+    Solo debe llamarse si available() es True.
+    """
+    source = np.ascontiguousarray(resampled, dtype=np.float32)
+    frames = source.reshape(len(source), -1)
+    out = np.empty((length, frames.shape[1]), dtype=np.float32)
+    _kernel()(frames, out)
+    return out.reshape((length,) + source.shape[1:])
@@ -0,0 +1,22 @@
+"""
+Kernel Numba de _interp_kernel.
+Solo se importa si Numba está instalado: importar este módulo sin Numba
+lanza ImportError.
+"""
+import numba
+import numpy as np
+
+
+@numba.njit(parallel=True, fastmath=True, cache=True)
+def fused_interp(resampled, out):
+    n_src = resampled.shape[0]
+    n_out = out.shape[0]
+    step = (n_src - 1) / (n_out - 1) if n_out > 1 else 0.0
+
+    for i in numba.prange(n_out):
+        pos = i * step
+        i0 = int(pos)
+        i1 = min(i0 + 1, n_src - 1)
+        f = np.float32(pos - i0)
+        for c in range(out.shape[1]):
+            out[i, c] = resampled[i0, c] * (1 - f) + resampled[i1, c] * f
@@ -0,0 +1,76 @@
+"""
+Backend de resampling compartido por SpeedEffect y PitchEffect.
+Usa la librería más rápida disponible: libsamplerate (samplerate),
+resampy o, como último recurso, scipy.signal.resample_poly.
+
+Las librerías se importan al primer resample: quien solo reproduce
+sonidos nunca paga el import de scipy (ni de numba vía resampy).
+"""
+from functools import lru_cache
+from math import gcd
+import numpy as np
+
+
+@lru_cache(maxsize=1)
+def backend() -> tuple:
+    """
+    Elige el backend una sola vez.
+
+    Returns:
+        (nombre, módulo) con nombre en 'samplerate', 'resampy' o 'scipy'
+    """
+    try:
+        import samplerate
+        return 'samplerate', samplerate
+    except ImportError:
+        pass
+
+    try:
+        import resampy
+        return 'resampy', resampy
+    except ImportError:
+        pass
+
+    from scipy import signal
+    return 'scipy', signal
+
+
+@lru_cache(maxsize=32)
+def _poly_filter(up: int, down: int) -> np.ndarray:
+    """
+    Filtro FIR anti-aliasing para resample_poly.
+    Mismo diseño que usa scipy por defecto, calculado una vez por ratio.
+    En float32 para que upfirdn no promocione la señal a float64.
+    """
+    from scipy import signal
+
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    window = signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+    return window.astype(np.float32)
+
+
+def resample(samples: np.ndarray, sr_in: int, sr_out: int) -> np.ndarray:
+    """
+    Resamplea sobre el eje temporal (axis 0), mono o stereo.
+
+    Args:
+        samples: Array numpy float32 (frames) o (frames, canales)
+        sr_in: Frecuencia (o factor entero) de entrada
+        sr_out: Frecuencia (o factor entero) de salida
+
+    Returns:
+        Array numpy float32 con ~len(samples) * sr_out / sr_in frames
+    """
+    name, module = backend()
+
+    if name == 'samplerate':
+        result = module.resample(samples, sr_out / sr_in, 'sinc_fastest')
+    elif name == 'resampy':
+        result = module.resample(samples, sr_in, sr_out, axis=0)
+    else:
+        divisor = gcd(sr_in, sr_out)
+        up, down = sr_out // divisor, sr_in // divisor
+        result = module.resample_poly(samples, up, down, axis=0, window=_poly_filter(up, down))
+
+    return result.astype(np.float32, copy=False)
@@ -17,11 +17,11 @@ class AudioEffect(ABC):
         Aplica el efecto a las muestras de audio.
         
         Args:
-            samples: Array numpy con las muestras (mono o stereo)
+            samples: Array numpy float32 con las muestras (mono o stereo)
             samplerate: Frecuencia de muestreo
         
         Returns:
-            Array numpy con las muestras procesadas
+            Array numpy float32 con las muestras procesadas
         """
         pass
     
@@ -1,9 +1,19 @@
 """
 Efecto de Pitch - Cambia el tono sin modificar la velocidad
 """
+from fractions import Fraction
 import numpy as np
-from scipy import signal
 from  pulseboard.audio.effects.base_effect import AudioEffect
+from pulseboard.audio.effects import _interp_kernel, _resample_backend
+
+
+def _interpolation_indices(source_length: int, length: int) -> tuple:
+    """Índices vecinos y fracciones para interpolar source_length -> length"""
+    positions = np.linspace(0, source_length - 1, length)
+    left = positions.astype(np.int32)
+    right = np.minimum(left + 1, source_length - 1).astype(np.int32)
+    frac = (positions - left).astype(np.float32)
+    return left, right, frac
 
 
 class PitchEffect(AudioEffect):
@@ -22,6 +32,10 @@ class PitchEffect(AudioEffect):
             raise ValueError("pitch_shift must be positive")
         
         self.pitch_shift = pitch_shift
+        
+        # Pitch más agudo = menos muestras: ratio inverso al pitch_shift
+        shift = Fraction(pitch_shift).limit_denominator(1000)
+        self._ratio = (shift.denominator, shift.numerator)
     
     @property
     def name(self) -> str:
@@ -29,32 +43,33 @@ class PitchEffect(AudioEffect):
     
     def apply(self, samples: np.ndarray, samplerate: int) -> np.ndarray:
         """
-        Aplica el cambio de pitch usando resampling.
+        Aplica el cambio de pitch resampleando con el backend disponible.
         Método simple: resample + interpolación para mantener duración.
         """
         if self.pitch_shift == 1.0:
             return samples
         
-        # Si es stereo, procesar cada canal
-        if len(samples.shape) > 1 and samples.shape[1] > 1:
-            processed_channels = []
-            for channel in range(samples.shape[1]):
-                processed = self._shift_pitch_channel(samples[:, channel])
-                processed_channels.append(processed)
-            return np.column_stack(processed_channels)
-        else:
-            return self._shift_pitch_channel(samples)
+        # float32 contiguo: el audio no necesita más precisión y evita
+        # que el resample trabaje al doble de ancho de banda en float64
+        samples = np.ascontiguousarray(samples, dtype=np.float32)
+        
+        # Resample a len / pitch_shift muestras sobre el eje temporal:
+        # mono y stereo en una sola llamada
+        up, down = self._ratio
+        resampled = _resample_backend.resample(samples, down, up)
+        
+        # Volver a la longitud original para mantener duración
+        return self._interpolate_to_length(resampled, len(samples))
     
-    def _shift_pitch_channel(self, channel_data: np.ndarray) -> np.ndarray:
-        """Aplica pitch shift a un canal mono"""
-        # Número de muestras después del pitch shift
-        new_length = int(len(channel_data) / self.pitch_shift)
+    def _interpolate_to_length(self, resampled: np.ndarray, length: int) -> np.ndarray:
+        """Interpolación lineal a length muestras, todos los canales a la vez"""
+        if _interp_kernel.available():
+            return _interp_kernel.interpolate_to_length(resampled, length)
         
-        # Resample
-        resampled = signal.resample(channel_data, new_length)
+        left, right, frac = _interpolation_indices(len(resampled), length)
         
-        # Interpolate back to original length para mantener duración
-        indices = np.linspace(0, len(resampled) - 1, len(channel_data))
-        interpolated = np.interp(indices, np.arange(len(resampled)), resampled)
+        if resampled.ndim > 1:
+            frac = frac[:, np.newaxis]
         
+        interpolated = resampled[left] * (1 - frac) + resampled[right] * frac
         return interpolated.astype(np.float32)
\ No newline at end of file
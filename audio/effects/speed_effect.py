@@ -1,9 +1,10 @@
 """
 Efecto de velocidad - Cambia la velocidad y el pitch simultáneamente
 """
+from fractions import Fraction
 import numpy as np
-from scipy import signal
 from pulseboard.audio.effects.base_effect import AudioEffect
+from pulseboard.audio.effects import _resample_backend
 
 
 class SpeedEffect(AudioEffect):
@@ -22,6 +23,9 @@ class SpeedEffect(AudioEffect):
             raise ValueError("speed must be positive")
         
         self.speed = speed
+        
+        # Más rápido = menos muestras: ratio de salida inverso a speed
+        self._ratio = Fraction(1.0 / speed).limit_denominator(1000).as_integer_ratio()
     
     @property
     def name(self) -> str:
@@ -33,28 +37,19 @@ class SpeedEffect(AudioEffect):
     
     def apply(self, samples: np.ndarray, samplerate: int) -> np.ndarray:
         """
-        Aplica el cambio de velocidad usando resampling.
+        Aplica el cambio de velocidad resampleando con el backend disponible.
         Cambia tanto la duración como el pitch.
         """
         if self.speed == 1.0:
             return samples
         
-        # Calcular nueva longitud
-        new_length = int(len(samples) / self.speed)
-        
-        # Resample
-        if len(samples.shape) > 1 and samples.shape[1] > 1:
-            # Stereo
-            processed_channels = []
-            for channel in range(samples.shape[1]):
-                resampled = signal.resample(samples[:, channel], new_length)
-                processed_channels.append(resampled)
-            result = np.column_stack(processed_channels)
-        else:
-            # Mono
-            result = signal.resample(samples, new_length)
+        # float32 contiguo: el audio no necesita más precisión y evita
+        # que el resample trabaje al doble de ancho de banda en float64
+        samples = np.ascontiguousarray(samples, dtype=np.float32)
         
-        return result.astype(np.float32)
+        # Resample sobre el eje temporal: mono y stereo en una sola llamada
+        up, down = self._ratio
+        return _resample_backend.resample(samples, down, up)
 
 
 class SlowedEffect(SpeedEffect):
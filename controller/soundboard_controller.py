@@ -3,14 +3,19 @@ Controller - Facade entre UI y Application Services
 Coordina hotkeys, filesystem y traduce eventos de UI en Commands.
 """
 import keyboard
+import logging
+from contextlib import contextmanager
 from typing import Optional, Callable, List, Dict
 
 from pulseboard.application.soundboard_service import SoundboardService
 from pulseboard.application.recording_service import RecordingService
-from pulseboard.application import commands
+from pulseboard.application import commands, events
 from pulseboard.domain.sound import Sound
 
 
+log = logging.getLogger(__name__)
+
+
 class SoundboardController:
     """
     Controlador principal que coordina UI, servicios y hotkeys.
@@ -28,24 +33,38 @@ class SoundboardController:
         # Observers para notificar a la UI
         self._sound_added_listeners: List[Callable[[Sound], None]] = []
         self._sound_removed_listeners: List[Callable[[str], None]] = []
+        self._sounds_added_listeners: List[Callable[[List[Sound]], None]] = []
+        self._sounds_removed_listeners: List[Callable[[List[str]], None]] = []
         self._sound_updated_listeners: List[Callable[[Sound], None]] = []
+        self._sound_changed_listeners: List[Callable[[Sound, object], None]] = []
         self._category_created_listeners: List[Callable[[str], None]] = []
         self._recording_started_listeners: List[Callable[[], None]] = []
         self._recording_stopped_listeners: List[Callable[[Sound], None]] = []
         
+        # Notificaciones acumuladas dentro de batch_notifications()
+        self._pending_added: Optional[List[Sound]] = None
+        self._pending_removed: Optional[List[str]] = None
+        
         # Hotkey handlers
         self._hotkey_handlers: Dict[str, any] = {}
+        self._hotkey_owners: Dict[str, str] = {}  # hotkey -> sound_id
     
     # ==================== INITIALIZATION ====================
     
     def initialize(self):
         """Inicializa el controller: carga config y setup hotkeys"""
         self.soundboard_service.load_config()
+        
+        with self.batch_notifications():
+            for sound in self.get_all_sounds():
+                self._notify_sound_added(sound)
+        
         self.setup_hotkeys()
     
     def shutdown(self):
         """Limpieza al cerrar"""
         self.cleanup_hotkeys()
+        self.soundboard_service.flush(final=True)
         self.soundboard_service.config_repo.cleanup_empty_categories()
     
     # ==================== PLAYBACK ====================
@@ -74,7 +93,7 @@ class SoundboardController:
         
         sound = self.soundboard_service.soundboard.get_sound(sound_id)
         if sound:
-            self._notify_sound_updated(sound)
+            self._notify_sound_updated(sound, events.VolumeChanged(sound_id, sound.volume))
     
     def toggle_loop(self, sound_id: str):
         """Alterna el loop"""
@@ -83,20 +102,24 @@ class SoundboardController:
         
         sound = self.soundboard_service.soundboard.get_sound(sound_id)
         if sound:
-            self._notify_sound_updated(sound)
+            self._notify_sound_updated(sound, events.LoopToggled(sound_id, sound.loop))
     
     def assign_hotkey(self, sound_id: str, hotkey: str):
         """Asigna un hotkey"""
         try:
+            sound = self.soundboard_service.soundboard.get_sound(sound_id)
+            old_hotkey = sound.hotkey if sound else ""
+            
             cmd = commands.AssignHotkey(sound_id, hotkey)
             self.soundboard_service.handle(cmd)
             
-            # Re-setup hotkeys
-            self.setup_hotkeys()
+            # Solo cambia este hotkey: no hace falta re-registrar todos
+            if old_hotkey:
+                self._remove_hotkey(old_hotkey)
             
-            sound = self.soundboard_service.soundboard.get_sound(sound_id)
             if sound:
-                self._notify_sound_updated(sound)
+                self._register_hotkey(sound)
+                self._notify_sound_updated(sound, events.HotkeyAssigned(sound_id, sound.hotkey))
             
             return True
         except ValueError as e:
@@ -110,19 +133,25 @@ class SoundboardController:
         file_path: str,
         category: str,
         hotkey: str = "",
-        volume: float = 1.0
+        volume: Optional[float] = None
     ) -> str:
-        """Agrega un sonido desde un archivo"""
+        """
+        Agrega un sonido desde un archivo.
+        Si el mismo archivo ya está en la categoría devuelve ese sonido,
+        con el hotkey y volumen pedidos aplicados.
+        """
         cmd = commands.AddSoundFromFile(file_path, category, hotkey, volume)
         sound_id = self.soundboard_service.handle(cmd)
         
         sound = self.soundboard_service.soundboard.get_sound(sound_id)
         if sound:
+            # Si era un duplicado la UI ya tiene su card: el update le lleva
+            # el volumen/hotkey nuevos (para una card nueva no cambia nada)
             self._notify_sound_added(sound)
+            self._notify_sound_updated(sound)
             
-            # Setup hotkeys si tiene
-            if hotkey:
-                self.setup_hotkeys()
+            # Registrar su hotkey si tiene
+            self._register_hotkey(sound)
         
         return sound_id
     
@@ -145,7 +174,7 @@ class SoundboardController:
         
         sound = self.soundboard_service.soundboard.get_sound(sound_id)
         if sound:
-            self._notify_sound_updated(sound)
+            self._notify_sound_updated(sound, events.ImageSet(sound_id, sound.image_path))
     
     def rename_sound(self, sound_id: str, new_name: str):
         """Renombra un sonido"""
@@ -154,7 +183,7 @@ class SoundboardController:
         
         sound = self.soundboard_service.soundboard.get_sound(sound_id)
         if sound:
-            self._notify_sound_updated(sound)
+            self._notify_sound_updated(sound, events.SoundRenamed(sound_id, sound.name))
     
     def move_sound_to_category(self, sound_id: str, target_category: str):
         """Mueve un sonido a otra categoría"""
@@ -183,6 +212,10 @@ class SoundboardController:
         
         cmd = commands.DeleteCategory(name)
         self.soundboard_service.handle(cmd)
+        
+        with self.batch_notifications():
+            for sound in sounds:
+                self._notify_sound_removed(sound.id)
     
     # ==================== RECORDING ====================
     
@@ -233,6 +266,28 @@ class SoundboardController:
         if sound:
             self._notify_sound_updated(sound)
     
+    def apply_effect_bulk(
+        self, sound_ids: List[str], effect_name: str, parameters: dict = None
+    ) -> Dict[str, Exception]:
+        """
+        Aplica un efecto a varios sonidos (procesados en paralelo).
+        Devuelve sound_id -> error de los que fallaron; el resto se aplica igual.
+        """
+        if parameters is None:
+            parameters = {}
+        
+        failures = self.soundboard_service.apply_effect_batch(sound_ids, effect_name, parameters)
+        
+        # Notificar en el hilo que llama, una vez por sonido cambiado
+        for sound_id in sound_ids:
+            if sound_id in failures:
+                continue
+            sound = self.soundboard_service.soundboard.get_sound(sound_id)
+            if sound:
+                self._notify_sound_updated(sound)
+        
+        return failures
+    
     def trim_sound(self, sound_id: str, start_time: float, end_time: float):
         """Recorta un sonido"""
         cmd = commands.TrimSound(sound_id, start_time, end_time)
@@ -263,7 +318,7 @@ class SoundboardController:
     # ==================== HOTKEYS ====================
     
     def setup_hotkeys(self):
-        """Configura todos los hotkeys globales"""
+        """Configura todos los hotkeys globales (carga inicial)"""
         # Limpiar hotkeys existentes
         self.cleanup_hotkeys()
         
@@ -276,20 +331,28 @@ class SoundboardController:
         """Limpia todos los hotkeys"""
         keyboard.unhook_all()
         self._hotkey_handlers.clear()
+        self._hotkey_owners.clear()
     
     def _register_hotkey(self, sound: Sound):
         """Registra un hotkey para un sonido"""
         if not sound.hotkey:
             return
         
+        # Reemplazar un registro previo de la misma tecla y cualquier otra
+        # tecla que todavía apunte a este sonido
+        self._remove_hotkey(sound.hotkey)
+        for hotkey in [k for k, sid in self._hotkey_owners.items() if sid == sound.id]:
+            self._remove_hotkey(hotkey)
+        
         def handler():
             self.play_sound(sound.id)
         
         try:
             h = keyboard.add_hotkey(sound.hotkey.lower(), handler)
             self._hotkey_handlers[sound.hotkey] = h
+            self._hotkey_owners[sound.hotkey] = sound.id
         except Exception as e:
-            print(f"Failed to register hotkey {sound.hotkey}: {e}")
+            log.warning("Failed to register hotkey %s: %s", sound.hotkey, e)
     
     def _remove_hotkey(self, hotkey: str):
         """Remueve un hotkey específico"""
@@ -297,8 +360,9 @@ class SoundboardController:
             try:
                 keyboard.remove_hotkey(self._hotkey_handlers[hotkey])
                 del self._hotkey_handlers[hotkey]
+                self._hotkey_owners.pop(hotkey, None)
             except Exception as e:
-                print(f"Failed to remove hotkey {hotkey}: {e}")
+                log.warning("Failed to remove hotkey %s: %s", hotkey, e)
     
     # ==================== OBSERVERS ====================
     
@@ -310,10 +374,26 @@ class SoundboardController:
         """Registra listener para cuando se elimina un sonido"""
         self._sound_removed_listeners.append(listener)
     
+    def on_sounds_added(self, listener: Callable[[List[Sound]], None]):
+        """Registra listener que recibe los sonidos agregados en lote"""
+        self._sounds_added_listeners.append(listener)
+    
+    def on_sounds_removed(self, listener: Callable[[List[str]], None]):
+        """Registra listener que recibe los IDs eliminados en lote"""
+        self._sounds_removed_listeners.append(listener)
+    
     def on_sound_updated(self, listener: Callable[[Sound], None]):
         """Registra listener para cuando se actualiza un sonido"""
         self._sound_updated_listeners.append(listener)
     
+    def on_sound_changed(self, listener: Callable[[Sound, object], None]):
+        """
+        Registra listener que recibe (sonido, evento) en cada actualización.
+        El evento (ver application.events) dice qué cambió; None si el cambio
+        no es puntual (efectos, recorte, cambio de categoría).
+        """
+        self._sound_changed_listeners.append(listener)
+    
     def on_category_created(self, listener: Callable[[str], None]):
         """Registra listener para cuando se crea una categoría"""
         self._category_created_listeners.append(listener)
@@ -326,17 +406,62 @@ class SoundboardController:
         """Registra listener para cuando termina una grabación"""
         self._recording_stopped_listeners.append(listener)
     
+    @contextmanager
+    def batch_notifications(self):
+        """
+        Acumula las altas y bajas de sonidos y las emite al salir:
+        una sola llamada por listener de lote en vez de una por sonido.
+        """
+        if self._pending_added is not None:
+            # Ya dentro de un lote: el externo emite todo
+            yield
+            return
+        
+        self._pending_added = []
+        self._pending_removed = []
+        try:
+            yield
+        finally:
+            added, removed = self._pending_added, self._pending_removed
+            self._pending_added = None
+            self._pending_removed = None
+            
+            if added:
+                self._emit_sounds_added(added)
+            if removed:
+                self._emit_sounds_removed(removed)
+    
     def _notify_sound_added(self, sound: Sound):
-        for listener in self._sound_added_listeners:
-            listener(sound)
+        if self._pending_added is not None:
+            self._pending_added.append(sound)
+        else:
+            self._emit_sounds_added([sound])
     
     def _notify_sound_removed(self, sound_id: str):
+        if self._pending_removed is not None:
+            self._pending_removed.append(sound_id)
+        else:
+            self._emit_sounds_removed([sound_id])
+    
+    def _emit_sounds_added(self, sounds: List[Sound]):
+        for listener in self._sounds_added_listeners:
+            listener(sounds)
+        for listener in self._sound_added_listeners:
+            for sound in sounds:
+                listener(sound)
+    
+    def _emit_sounds_removed(self, sound_ids: List[str]):
+        for listener in self._sounds_removed_listeners:
+            listener(sound_ids)
         for listener in self._sound_removed_listeners:
-            listener(sound_id)
+            for sound_id in sound_ids:
+                listener(sound_id)
     
-    def _notify_sound_updated(self, sound: Sound):
+    def _notify_sound_updated(self, sound: Sound, event=None):
         for listener in self._sound_updated_listeners:
             listener(sound)
+        for listener in self._sound_changed_listeners:
+            listener(sound, event)
     
     def _notify_category_created(self, category: str):
         for listener in self._category_created_listeners:
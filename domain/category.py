@@ -1,32 +1,40 @@
-from typing import List, Optional
+from typing import List, Optional, Set
 from pulseboard.domain.sound import Sound
 
 
 class Category:
     """Entidad de dominio que representa una categoría de sonidos."""
 
+    __slots__ = ('name', 'sounds', 'visible', '_sound_ids')
+
     def __init__(self, name: str):
         if not name:
             raise ValueError("Category name cannot be empty")
 
         self.name = name
         self.sounds: List[Sound] = []
+        self._sound_ids: Set[str] = set()  # espejo de sounds para pertenencia O(1)
         self.visible: bool = True
 
     def add_sound(self, sound: Sound) -> None:
-        if sound not in self.sounds:
+        if sound.id not in self._sound_ids:
+            self._sound_ids.add(sound.id)
             self.sounds.append(sound)
 
     def remove_sound(self, sound: Sound) -> None:
-        if sound in self.sounds:
+        if sound.id in self._sound_ids:
+            self._sound_ids.discard(sound.id)
             self.sounds.remove(sound)
 
     def toggle_visibility(self) -> None:
         self.visible = not self.visible
 
     def get_sound_by_key(self, key: str) -> Optional[Sound]:
+        # Sin índice propio: un hotkey puede cambiar por Soundboard sin pasar
+        # por la categoría; la búsqueda indexada es Soundboard.find_sound_by_hotkey
+        key = key.upper()
         for sound in self.sounds:
-            if sound.key == key.upper():
+            if sound.hotkey == key:
                 return sound
         return None
 
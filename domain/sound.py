@@ -4,10 +4,15 @@ No conoce audio, UI ni persistencia. Solo estado y reglas de negocio.
 """
 from dataclasses import dataclass, field
 from typing import Optional
+import os
 import uuid
 
 
-@dataclass
+_splitext = os.path.splitext
+_basename = os.path.basename
+
+
+@dataclass(slots=True)
 class Sound:
     """
     Representa un sonido en el dominio.
@@ -29,6 +34,15 @@ class Sound:
     # Efectos aplicados (nombres de efectos)
     effects: list[str] = field(default_factory=list)
     
+    # Caché de to_dict: los métodos que modifican el sonido suben la versión.
+    # Asignar atributos directamente no la invalida: usar los métodos.
+    _version: int = field(default=0, init=False, repr=False, compare=False)
+    _dict_cache: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def _touch(self) -> None:
+        """Invalida el diccionario cacheado"""
+        self._version += 1
+    
     def __post_init__(self):
         """Validaciones de dominio"""
         if not 0 <= self.volume <= 1:
@@ -36,44 +50,79 @@ class Sound:
         
         if self.file_path and not self.name:
             # Auto-generar nombre desde el archivo
-            import os
-            self.name = os.path.splitext(os.path.basename(self.file_path))[0]
+            self.name = _splitext(_basename(self.file_path))[0]
     
     def set_volume(self, volume: float) -> None:
         """Establece el volumen con validación"""
         if not 0 <= volume <= 1:
             raise ValueError(f"Volume must be between 0 and 1, got {volume}")
         self.volume = volume
+        self._touch()
     
     def toggle_loop(self) -> None:
         """Alterna el estado de loop"""
         self.loop = not self.loop
+        self._touch()
     
     def assign_hotkey(self, key: str) -> None:
         """Asigna una tecla de acceso rápido"""
         self.hotkey = key.upper() if key else ""
+        self._touch()
     
     def set_image(self, path: str) -> None:
         """Establece la imagen asociada"""
         self.image_path = path
+        self._touch()
+    
+    def rename(self, name: str) -> None:
+        """Cambia el nombre visible"""
+        self.name = name
+        self._touch()
+    
+    def set_file_path(self, path: str) -> None:
+        """Apunta el sonido a otro archivo (movido, recortado, con efecto)"""
+        self.file_path = path
+        self._touch()
+    
+    def set_category(self, category: str) -> None:
+        """Cambia la categoría a la que pertenece"""
+        self.category = category
+        self._touch()
     
     def add_effect(self, effect_name: str) -> None:
         """Agrega un efecto a la lista"""
         if effect_name not in self.effects:
             self.effects.append(effect_name)
+            self._touch()
     
     def remove_effect(self, effect_name: str) -> None:
         """Remueve un efecto de la lista"""
         if effect_name in self.effects:
             self.effects.remove(effect_name)
+            self._touch()
     
     def clear_effects(self) -> None:
         """Limpia todos los efectos"""
         self.effects = []
+        self._touch()
     
     def to_dict(self) -> dict:
-        """Serializa a diccionario para persistencia"""
-        return {
+        """Serializa a diccionario (una copia que el llamador puede modificar)"""
+        data = dict(self._shared_dict())
+        data["effects"] = list(data["effects"])
+        return data
+    
+    def _shared_dict(self) -> dict:
+        """
+        Diccionario de persistencia cacheado: se reutiliza mientras el
+        sonido no cambie, y el guardado lo reconoce por identidad para no
+        volver a codificarlo. Es de solo lectura: no debe modificarse.
+        """
+        version = self._version
+        if self._dict_cache is not None and self._dict_cache[0] == version:
+            return self._dict_cache[1]
+        
+        data = {
             "id": self.id,
             "name": self.name,
             "file_path": self.file_path,
@@ -82,8 +131,10 @@ class Sound:
             "loop": self.loop,
             "hotkey": self.hotkey,
             "image_path": self.image_path,
-            "effects": self.effects
+            "effects": list(self.effects)
         }
+        self._dict_cache = (version, data)
+        return data
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Sound':
@@ -2,7 +2,7 @@
 Agregado raíz del dominio - Soundboard
 Gestiona la colección de sonidos y categorías con reglas de negocio.
 """
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from pulseboard.domain.sound import Sound
 
 
@@ -14,7 +14,10 @@ class Soundboard:
     
     def __init__(self):
         self._sounds: Dict[str, Sound] = {}  # id -> Sound
-        self._categories: Dict[str, List[str]] = {}  # category -> [sound_ids]
+        # category -> {sound_id: None}: dict como conjunto ordenado,
+        # pertenencia y borrado O(1) conservando el orden de alta
+        self._categories: Dict[str, Dict[str, None]] = {}
+        self._hotkey_index: Dict[str, str] = {}  # hotkey -> sound_id
     
     def add_sound(self, sound: Sound) -> None:
         """
@@ -25,15 +28,21 @@ class Soundboard:
         if sound.hotkey and self._is_hotkey_in_use(sound.hotkey, exclude_id=sound.id):
             raise ValueError(f"Hotkey '{sound.hotkey}' is already in use")
         
-        # Agregar a la colección
+        # Agregar a la colección (reemplazando el hotkey anterior si existía)
+        previous = self._sounds.get(sound.id)
+        if previous is not None:
+            self._unindex_hotkey(previous)
+        
         self._sounds[sound.id] = sound
         
+        if sound.hotkey:
+            self._hotkey_index[sound.hotkey] = sound.id
+        
         # Agregar a la categoría
         if sound.category not in self._categories:
-            self._categories[sound.category] = []
+            self._categories[sound.category] = {}
         
-        if sound.id not in self._categories[sound.category]:
-            self._categories[sound.category].append(sound.id)
+        self._categories[sound.category].setdefault(sound.id, None)
     
     def remove_sound(self, sound_id: str) -> None:
         """Elimina un sonido del soundboard"""
@@ -44,14 +53,14 @@ class Soundboard:
         
         # Remover de la categoría
         if sound.category in self._categories:
-            if sound_id in self._categories[sound.category]:
-                self._categories[sound.category].remove(sound_id)
+            self._categories[sound.category].pop(sound_id, None)
             
             # Limpiar categoría vacía
             if not self._categories[sound.category]:
                 del self._categories[sound.category]
         
         # Remover del diccionario principal
+        self._unindex_hotkey(sound)
         del self._sounds[sound_id]
     
     def get_sound(self, sound_id: str) -> Optional[Sound]:
@@ -75,10 +84,8 @@ class Soundboard:
     
     def find_sound_by_hotkey(self, hotkey: str) -> Optional[Sound]:
         """Encuentra un sonido por su hotkey"""
-        for sound in self._sounds.values():
-            if sound.hotkey == hotkey.upper():
-                return sound
-        return None
+        sound_id = self._hotkey_index.get(hotkey.upper())
+        return self._sounds.get(sound_id) if sound_id else None
     
     def update_sound_hotkey(self, sound_id: str, new_hotkey: str) -> None:
         """
@@ -93,22 +100,27 @@ class Soundboard:
         if new_hotkey and self._is_hotkey_in_use(new_hotkey, exclude_id=sound_id):
             raise ValueError(f"Hotkey '{new_hotkey}' is already in use")
         
-        self._sounds[sound_id].assign_hotkey(new_hotkey)
+        sound = self._sounds[sound_id]
+        self._unindex_hotkey(sound)
+        sound.assign_hotkey(new_hotkey)
+        
+        if sound.hotkey:
+            self._hotkey_index[sound.hotkey] = sound_id
     
     def _is_hotkey_in_use(self, hotkey: str, exclude_id: Optional[str] = None) -> bool:
         """Verifica si un hotkey ya está en uso"""
-        hotkey = hotkey.upper()
-        for sid, sound in self._sounds.items():
-            if sid == exclude_id:
-                continue
-            if sound.hotkey == hotkey:
-                return True
-        return False
+        sound_id = self._hotkey_index.get(hotkey.upper())
+        return sound_id is not None and sound_id != exclude_id
+    
+    def _unindex_hotkey(self, sound: Sound) -> None:
+        """Quita el hotkey de un sonido del índice, si le pertenece"""
+        if sound.hotkey and self._hotkey_index.get(sound.hotkey) == sound.id:
+            del self._hotkey_index[sound.hotkey]
     
     def create_category(self, category_name: str) -> None:
         """Crea una categoría vacía"""
         if category_name not in self._categories:
-            self._categories[category_name] = []
+            self._categories[category_name] = {}
     
     def rename_category(self, old_name: str, new_name: str) -> None:
         """Renombra una categoría y actualiza todos sus sonidos"""
@@ -121,7 +133,7 @@ class Soundboard:
         # Actualizar sonidos
         for sound_id in self._categories[old_name]:
             if sound_id in self._sounds:
-                self._sounds[sound_id].category = new_name
+                self._sounds[sound_id].set_category(new_name)
         
         # Renombrar categoría
         self._categories[new_name] = self._categories.pop(old_name)
@@ -134,20 +146,30 @@ class Soundboard:
         if category_name not in self._categories:
             return
         
-        # Eliminar todos los sonidos de la categoría
-        sound_ids = self._categories[category_name].copy()
+        # Sacar la categoría primero: sus sonidos se borran sin
+        # actualizarla uno por uno ni copiar la lista de IDs
+        sound_ids = self._categories.pop(category_name)
         for sound_id in sound_ids:
-            self.remove_sound(sound_id)
-        
-        # Eliminar categoría
-        if category_name in self._categories:
-            del self._categories[category_name]
+            sound = self._sounds.pop(sound_id, None)
+            if sound is not None:
+                self._unindex_hotkey(sound)
     
     def to_dict(self) -> dict:
         """Serializa el soundboard completo"""
         return {
             "sounds": [s.to_dict() for s in self._sounds.values()],
-            "categories": list(self._categories.keys())
+            "categories": list(self._categories)
+        }
+    
+    def snapshot(self) -> dict:
+        """
+        Como to_dict, pero con los diccionarios cacheados de cada sonido en
+        vez de copias: es barato y el repositorio reutiliza lo ya codificado.
+        De solo lectura; pensado para la persistencia.
+        """
+        return {
+            "sounds": [s._shared_dict() for s in self._sounds.values()],
+            "categories": list(self._categories)
         }
     
     @classmethod
@@ -164,4 +186,19 @@ class Soundboard:
             if category not in board._categories:
                 board.create_category(category)
         
-        return board
\ No newline at end of file
+        return board
+    
+    @classmethod
+    def from_shards(cls, shards: Iterable[Tuple[str, List[dict]]]) -> 'Soundboard':
+        """
+        Deserializa categoría por categoría, a medida que llegan.
+        Cada elemento es (nombre, [datos de sonido]).
+        """
+        board = cls()
+        
+        for category, sounds in shards:
+            board.create_category(category)
+            for sound_data in sounds:
+                board.add_sound(Sound.from_dict(sound_data))
+        
+        return board
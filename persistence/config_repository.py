@@ -1,20 +1,81 @@
 """
 Repositorio de configuración - Persistencia de estado
-Guarda y carga el Soundboard completo desde JSON.
+Guarda y carga el Soundboard en JSON, un archivo por categoría.
 """
+import hashlib
 import json
+import logging
+import mmap
 import os
+import shutil
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import sys
 
+try:
+    import msgspec
+    from pulseboard.persistence import schema
+except ImportError:
+    msgspec = None
+    schema = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # Windows
+
+
+log = logging.getLogger(__name__)
+
+
+def _dumps(data: dict, pretty: bool = False) -> bytes:
+    """Serializa a JSON UTF-8, compacto o indentado con 2 espacios"""
+    if msgspec is not None:
+        payload = msgspec.json.encode(data)
+        return msgspec.json.format(payload, indent=2) if pretty else payload
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads(payload, state_type: Optional[str] = None) -> dict:
+    """
+    Deserializa JSON desde bytes (o cualquier buffer con msgspec/orjson).
+    state_type nombra una clase de schema: con msgspec se decodifica
+    tipado y validado, y se devuelve como dict igual que sin él.
+    """
+    if msgspec is not None:
+        if state_type is None:
+            return msgspec.json.decode(payload)
+        state = msgspec.json.decode(payload, type=getattr(schema, state_type))
+        return msgspec.to_builtins(state)
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(bytes(payload))
+
 
 class ConfigRepository:
     """
     Maneja la persistencia del estado del soundboard.
-    Guarda en JSON en la carpeta de datos del usuario.
+    Guarda en JSON en la carpeta de datos del usuario: categories/<id>.json
+    por categoría e index.json con el orden de las categorías y el id de
+    archivo de cada una (ver _shard_id).
     """
     
+    FINGERPRINT_CHUNK = 64 * 1024  # bytes leídos al inicio y al final
+    MMAP_THRESHOLD = 256 * 1024    # configs más grandes se parsean vía mmap
+    SAVE_DELAY = 0.5               # segundos para agrupar guardados consecutivos
+    FICLONE = 0x40049409           # ioctl de Linux: clon copy-on-write (btrfs, xfs)
+    PRETTY_JSON = False            # True para depurar: JSON indentado (más lento y grande)
+    
     def __init__(self, base_dir: Optional[str] = None):
         """
         Args:
@@ -27,48 +88,283 @@ class ConfigRepository:
         self.user_data_dir = self.base_dir / "Soundboard"
         self.sound_folder = self.user_data_dir / "sounds"
         self.img_folder = self.user_data_dir / "img"
-        self.config_file = self.user_data_dir / "config.json"
+        self.config_file = self.user_data_dir / "config.json"  # formato anterior
+        self.categories_dir = self.user_data_dir / "categories"
+        self.index_file = self.user_data_dir / "index.json"
         
         # Crear directorios si no existen
         self.user_data_dir.mkdir(exist_ok=True)
         self.sound_folder.mkdir(exist_ok=True)
         self.img_folder.mkdir(exist_ok=True)
+        self.categories_dir.mkdir(exist_ok=True)
+        self._library_root = self.sound_folder.resolve()
+        
+        # Último contenido escrito: category -> dicts de sus sonidos
+        self._written_shards: Dict[str, list] = {}
+        self._written_index: Optional[List[str]] = None
+        
+        # Archivo que tiene hoy el shard de cada categoría según el índice
+        # escrito (o leído); puede no ser _shard_path si viene de una versión vieja
+        self._shard_files: Dict[str, Path] = {}
+        
+        # JSON ya codificado de cada sonido: sound_id -> (dict, bytes)
+        self._fragments: Dict[str, tuple] = {}
+        
+        # Carpetas de categoría ya creadas (evita un mkdir por sonido)
+        self._known_categories: Set[str] = set()
+        
+        # Guardado diferido
+        self._save_lock = threading.Lock()
+        self._pending_data: Optional[dict] = None
+        self._save_timer: Optional[threading.Timer] = None
+        self._closed = False  # tras close() no se programan más timers
     
     def save(self, soundboard_data: dict) -> None:
         """
-        Guarda el estado del soundboard.
+        Guarda el estado del soundboard: un JSON por categoría más
+        index.json con el orden de las categorías. Solo se reescriben
+        los shards cuyo contenido cambió desde el último guardado.
         
         Args:
-            soundboard_data: Diccionario con el estado (de Soundboard.to_dict())
+            soundboard_data: Diccionario con el estado (de Soundboard.snapshot() o to_dict())
         """
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(soundboard_data, f, indent=2, ensure_ascii=False)
+            shards = {name: [] for name in soundboard_data.get("categories", [])}
+            for sound_data in soundboard_data.get("sounds", []):
+                shards.setdefault(sound_data["category"], []).append(sound_data)
+            
+            for name, sounds in shards.items():
+                self.save_category(name, sounds)
+            
+            # El índice manda: se escribe después de los shards nuevos
+            # y antes de borrar los de categorías eliminadas o renombradas
+            categories = list(shards)
+            files = {name: self._shard_path(name) for name in categories}
+            if categories != self._written_index or any(
+                    self._shard_files.get(name) != path for name, path in files.items()):
+                self._write_json(self.index_file, {
+                    "categories": categories,
+                    "shards": {name: path.stem for name, path in files.items()},
+                })
+                self._written_index = categories
+                
+                current = set(files.values())
+                for path in self._shard_files.values():
+                    if path not in current:
+                        path.unlink(missing_ok=True)
+                self._shard_files = files
+            
+            for name in [n for n in self._written_shards if n not in shards]:
+                del self._written_shards[name]
+            
+            # Fragmentos de sonidos eliminados
+            if len(self._fragments) > len(soundboard_data.get("sounds", [])):
+                alive = {sound_data["id"] for sound_data in soundboard_data["sounds"]}
+                for sound_id in [sid for sid in self._fragments if sid not in alive]:
+                    del self._fragments[sound_id]
+            
+            # Formato anterior (un solo config.json): ya migrado
+            self.config_file.unlink(missing_ok=True)
         except Exception as e:
             raise RuntimeError(f"Failed to save config: {e}")
     
+    def save_category(self, name: str, sounds: list) -> None:
+        """
+        Reescribe el shard de una categoría si cambió.
+        Sound.to_dict devuelve el mismo dict mientras el sonido no cambia,
+        así que comparar por identidad alcanza para detectar cambios.
+        """
+        path = self._shard_path(name)
+        previous = self._written_shards.get(name)
+        if (previous is not None and self._shard_files.get(name) == path
+                and len(previous) == len(sounds)
+                and all(a is b for a, b in zip(previous, sounds))):
+            return
+        
+        self._write_bytes(path, self._encode_shard(sounds))
+        self._written_shards[name] = sounds
+    
+    def _encode_shard(self, sounds: list) -> bytes:
+        """
+        Codifica un shard reutilizando el JSON de los sonidos que no
+        cambiaron: solo se codifican los dicts nuevos y se empalman.
+        """
+        if self.PRETTY_JSON:
+            return _dumps({"sounds": sounds}, pretty=True)
+        
+        parts = []
+        for sound_data in sounds:
+            cached = self._fragments.get(sound_data["id"])
+            if cached is None or cached[0] is not sound_data:
+                cached = (sound_data, _dumps(sound_data))
+                self._fragments[sound_data["id"]] = cached
+            parts.append(cached[1])
+        
+        return b'{"sounds":[' + b','.join(parts) + b']}'
+    
+    def schedule_save(self, soundboard_data: dict) -> None:
+        """
+        Programa un guardado en SAVE_DELAY segundos.
+        Las llamadas seguidas se agrupan en una sola escritura con el
+        último estado recibido. soundboard_data debe ser una instantánea
+        tomada en el hilo que llama: el timer solo la escribe y nunca
+        lee el soundboard vivo.
+        """
+        with self._save_lock:
+            if self._closed:
+                # Cerrado: un timer daemon podría no llegar a correr
+                self.save(soundboard_data)
+                return
+            
+            self._pending_data = soundboard_data
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(self.SAVE_DELAY, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+    
+    def flush(self) -> None:
+        """Escribe ya el guardado pendiente, si lo hay"""
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            
+            data = self._pending_data
+            if data is None:
+                return
+            
+            self._pending_data = None
+            self.save(data)
+    
+    def close(self) -> None:
+        """
+        Escribe el guardado pendiente y cancela su timer. Los guardados
+        que se pidan después se escriben en el momento.
+        """
+        with self._save_lock:
+            self._closed = True
+        self.flush()
+    
     def load(self) -> Optional[dict]:
         """
-        Carga el estado del soundboard.
+        Carga el estado del soundboard, uniendo los shards de categoría.
+        Si todavía no hay índice, lee el config.json del formato anterior.
         
         Returns:
             Diccionario con el estado o None si no existe
         """
-        if not self.config_file.exists():
+        if not self.has_saved_state():
             return None
         
+        categories = []
+        sounds = []
+        for name, shard_sounds in self.load_streaming():
+            categories.append(name)
+            sounds.extend(shard_sounds)
+        
+        return {"sounds": sounds, "categories": categories}
+    
+    def has_saved_state(self) -> bool:
+        """True si hay configuración guardada (índice o formato anterior)"""
+        return self.index_file.exists() or self.config_file.exists()
+    
+    def load_streaming(self) -> Iterator[Tuple[str, List[dict]]]:
+        """
+        Carga el estado categoría por categoría: genera (nombre, sonidos)
+        leyendo un shard a la vez, así que en memoria solo está el JSON
+        de la categoría en curso.
+        """
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            index = self._read_json(self.index_file, 'IndexState')
+            if index is None:
+                yield from self._load_legacy()
+                return
+            
+            categories = index.get("categories", [])
+            shard_ids = index.get("shards") or {}
+            for name in categories:
+                # Índices viejos no tienen "shards": el archivo era <nombre>.json
+                shard_id = shard_ids.get(name)
+                if shard_id is None:
+                    path = self.categories_dir / f"{name}.json"
+                else:
+                    path = self.categories_dir / f"{Path(shard_id).name}.json"
+                self._shard_files[name] = path
+                
+                shard = self._read_json(path, 'ShardState')
+                # Conocido pero sin contenido comparable: se reescribe
+                # en el primer guardado si tiene sonidos
+                self._written_shards[name] = []
+                yield name, shard.get("sounds", []) if shard else []
+            
+            self._written_index = list(categories)
         except Exception as e:
             raise RuntimeError(f"Failed to load config: {e}")
     
+    def _load_legacy(self) -> Iterator[Tuple[str, List[dict]]]:
+        """Formato anterior: un solo config.json, agrupado por categoría"""
+        data = self._read_json(self.config_file, 'SoundboardState')
+        if not data:
+            return
+        
+        shards = {name: [] for name in data.get("categories", [])}
+        for sound_data in data.get("sounds", []):
+            shards.setdefault(sound_data.get("category", "General"), []).append(sound_data)
+        
+        yield from shards.items()
+    
+    @staticmethod
+    def _shard_id(category: str) -> str:
+        """
+        Nombre de archivo de una categoría: hash del nombre, así que vale
+        cualquier nombre ("AC/DC", ":", "?"...) y dos nombres que solo
+        difieren en mayúsculas no chocan en sistemas que no las distinguen.
+        """
+        return hashlib.blake2b(category.encode('utf-8'), digest_size=8).hexdigest()
+    
+    def _shard_path(self, category: str) -> Path:
+        """Archivo JSON de una categoría"""
+        return self.categories_dir / f"{self._shard_id(category)}.json"
+    
+    def _write_json(self, path: Path, data: dict) -> None:
+        """
+        Escribe JSON al lado y reemplaza: un corte a mitad de escritura
+        nunca deja el archivo a medias.
+        """
+        self._write_bytes(path, _dumps(data, self.PRETTY_JSON))
+    
+    def _write_bytes(self, path: Path, payload: bytes) -> None:
+        """Escritura atómica: archivo temporal al lado + os.replace"""
+        tmp = path.with_suffix('.json.tmp')
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    
+    def _read_json(self, path: Path, state_type: Optional[str] = None) -> Optional[dict]:
+        """Lee un archivo JSON (ver _loads); None si no existe"""
+        try:
+            with open(path, 'rb', buffering=0) as f:
+                size = os.fstat(f.fileno()).st_size
+                if (msgspec or orjson) is not None and size > self.MMAP_THRESHOLD:
+                    # Archivo grande: el parser lee directo de las páginas
+                    # mapeadas, sin copiar el archivo a un bytes intermedio
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                            memoryview(mm) as view:
+                        return _loads(view, state_type)
+                
+                payload = f.read()
+        except FileNotFoundError:
+            return None
+        
+        return _loads(payload, state_type)
+    
     def get_sound_path(self, category: str, filename: str) -> Path:
         """
         Construye la ruta para un archivo de sonido.
         """
         category_folder = self.sound_folder / category
-        category_folder.mkdir(exist_ok=True)
+        if category not in self._known_categories:
+            category_folder.mkdir(exist_ok=True)
+            self._known_categories.add(category)
         return category_folder / filename
     
     def get_image_path(self, filename: str) -> Path:
@@ -81,17 +377,27 @@ class ConfigRepository:
         """
         Elimina carpetas de categorías vacías.
         """
-        if not self.sound_folder.exists():
+        try:
+            entries = os.scandir(self.sound_folder)
+        except FileNotFoundError:
             return
         
-        for category_path in self.sound_folder.iterdir():
-            if category_path.is_dir():
-                # Verificar si está vacía
-                if not any(category_path.iterdir()):
-                    try:
-                        category_path.rmdir()
-                    except Exception as e:
-                        print(f"Could not remove empty category {category_path}: {e}")
+        # scandir trae el tipo de cada entrada junto con el nombre
+        with entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                
+                # Vacía si no tiene ni un primer hijo
+                with os.scandir(entry.path) as children:
+                    if next(children, None) is not None:
+                        continue
+                
+                try:
+                    os.rmdir(entry.path)
+                    self._known_categories.discard(entry.name)
+                except Exception as e:
+                    log.warning("Could not remove empty category %s: %s", entry.path, e)
     
     def delete_sound_file(self, file_path: str) -> None:
         """
@@ -102,7 +408,7 @@ class ConfigRepository:
             if path.exists():
                 path.unlink()
         except Exception as e:
-            print(f"Could not delete sound file {file_path}: {e}")
+            log.warning("Could not delete sound file %s: %s", file_path, e)
     
     def delete_image_file(self, file_path: str) -> None:
         """
@@ -113,7 +419,112 @@ class ConfigRepository:
             if path.exists():
                 path.unlink()
         except Exception as e:
-            print(f"Could not delete image file {file_path}: {e}")
+            log.warning("Could not delete image file %s: %s", file_path, e)
+    
+    def fingerprint(self, file_path: str) -> bytes:
+        """
+        Huella rápida del contenido de un archivo.
+        Combina el tamaño con los primeros y últimos 64 KB, así que el costo
+        no depende del tamaño del archivo.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            digest.update(size.to_bytes(8, 'little'))
+            digest.update(f.read(self.FINGERPRINT_CHUNK))
+            if size > self.FINGERPRINT_CHUNK:
+                f.seek(max(size - self.FINGERPRINT_CHUNK, self.FINGERPRINT_CHUNK))
+                digest.update(f.read(self.FINGERPRINT_CHUNK))
+        return digest.digest()
+    
+    def move_sound_file(self, source_path: str, dest_path: Path) -> Path:
+        """
+        Mueve un archivo de sonido.
+        En el mismo volumen es solo un rename; entre volúmenes copia y borra.
+        
+        Returns:
+            Path del archivo movido
+        """
+        try:
+            os.rename(source_path, dest_path)
+        except OSError:
+            self._copy_file(source_path, dest_path)
+            os.unlink(source_path)
+        return dest_path
+    
+    def duplicate_sound_file(self, source_path: str, dest_path: Path) -> Path:
+        """
+        Copia un archivo de sonido a una ruta concreta de la biblioteca.
+        Copia real (no hardlink): el destino puede reescribirse después.
+        
+        Returns:
+            Path del archivo copiado
+        """
+        self._copy_file(source_path, dest_path)
+        return dest_path
+    
+    def _copy_file(self, source_path, dest_path, exclusive: bool = False) -> None:
+        """
+        Copia el contenido de un archivo sin pasar por buffers de Python.
+        En Linux: reflink (clon copy-on-write) si el sistema de archivos lo
+        soporta, si no sendfile. En el resto, shutil.copyfile, que usa la
+        copia nativa del sistema (fcopyfile en macOS, CopyFile2 en Windows);
+        sendfile en macOS/BSD exige un socket como destino.
+        
+        Con exclusive=True lanza FileExistsError si el destino ya existe.
+        Si la copia falla, el destino creado se borra: no queda un archivo
+        vacío o a medias que bloquee el nombre.
+        """
+        if not sys.platform.startswith('linux'):
+            if exclusive:
+                # Reserva el destino atómicamente; copyfile lo sobreescribe
+                open(dest_path, 'xb').close()
+            try:
+                shutil.copyfile(source_path, dest_path)
+            except BaseException:
+                self._discard_partial(dest_path)
+                raise
+            return
+        
+        with open(source_path, 'rb') as src:
+            dst = open(dest_path, 'xb' if exclusive else 'wb')
+            try:
+                with dst:
+                    self._copy_contents(src, dst)
+            except BaseException:
+                self._discard_partial(dest_path)
+                raise
+    
+    def _copy_contents(self, src, dst) -> None:
+        """Reflink si se puede, si no sendfile (solo Linux)"""
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(dst.fileno(), self.FICLONE, src.fileno())
+                return
+            except OSError:
+                pass  # Sin reflink (ext4, otro volumen...)
+        
+        remaining = os.fstat(src.fileno()).st_size
+        offset = 0
+        try:
+            while remaining > 0:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        except OSError:
+            # Sistema de archivos sin sendfile: se sigue desde donde quedó
+            src.seek(offset)
+            shutil.copyfileobj(src, dst)
+    
+    @staticmethod
+    def _discard_partial(dest_path) -> None:
+        """Borra el destino de una copia fallida"""
+        try:
+            os.unlink(dest_path)
+        except OSError as e:
+            log.warning("Could not remove partial copy %s: %s", dest_path, e)
     
     def copy_sound_to_category(self, source_path: str, category: str) -> Path:
         """
@@ -122,16 +533,26 @@ class ConfigRepository:
         Returns:
             Path del archivo copiado
         """
-        import shutil
-        
         source = Path(source_path)
         dest = self.get_sound_path(category, source.name)
         
-        # Si ya existe, no copiar
-        if dest.exists():
-            return dest
+        # Sin stat previo: si el destino ya existe, link/open fallan con
+        # FileExistsError y no se copia
+        try:
+            # Ya está dentro de la biblioteca: un hardlink evita duplicar datos
+            if source.resolve().is_relative_to(self._library_root):
+                try:
+                    os.link(source, dest)
+                    return dest
+                except FileExistsError:
+                    raise
+                except OSError:
+                    pass  # Sistema de archivos sin hardlinks
+            
+            self._copy_file(source, dest, exclusive=True)
+        except FileExistsError:
+            pass
         
-        shutil.copy(source, dest)
         return dest
     
     def copy_image(self, source_path: str, new_filename: str) -> Path:
@@ -141,10 +562,8 @@ class ConfigRepository:
         Returns:
             Path de la imagen copiada
         """
-        import shutil
-        
         source = Path(source_path)
         dest = self.img_folder / new_filename
         
-        shutil.copy(source, dest)
+        self._copy_file(source, dest)
         return dest
\ No newline at end of file
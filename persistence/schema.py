@@ -0,0 +1,37 @@
+"""
+Esquema tipado de los archivos de configuración (msgspec, opcional).
+Con un tipo conocido msgspec decodifica y valida en una sola pasada,
+sin recorrer diccionarios genéricos.
+"""
+from typing import Dict, List, Optional
+import msgspec
+
+
+class SoundState(msgspec.Struct):
+    """Un sonido tal como lo serializa Sound.to_dict()"""
+    id: str
+    name: str = ""
+    file_path: str = ""
+    category: str = "General"
+    volume: float = 1.0
+    loop: bool = False
+    hotkey: str = ""
+    image_path: Optional[str] = None
+    effects: List[str] = []
+
+
+class ShardState(msgspec.Struct):
+    """Archivo categories/<nombre>.json"""
+    sounds: List[SoundState] = []
+
+
+class IndexState(msgspec.Struct):
+    """Archivo index.json"""
+    categories: List[str] = []
+    shards: Dict[str, str] = {}  # categoría -> id de archivo en categories/
+
+
+class SoundboardState(msgspec.Struct):
+    """config.json del formato anterior (un solo archivo)"""
+    sounds: List[SoundState] = []
+    categories: List[str] = []
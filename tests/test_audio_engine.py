@@ -0,0 +1,142 @@
+"""
+Tests de AudioEngine: ring SPSC de grabación
+"""
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# pygame.mixer.init() sin tarjeta de sonido
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+try:
+    import numpy as np
+    import soundfile as sf
+    from pulseboard.audio import audio_engine
+    from pulseboard.audio.audio_engine import AudioEngine
+except ImportError as e:
+    raise unittest.SkipTest(f"audio dependencies not installed: {e}")
+
+
+class _SmallRingEngine(AudioEngine):
+    RECORDING_SLOTS = 4
+
+
+class _FakeInputStream:
+    """Sustituye al stream de PortAudio: el test llama al callback a mano"""
+    
+    def __init__(self, callback, **kwargs):
+        self.callback = callback
+    
+    def start(self):
+        pass
+    
+    def stop(self):
+        pass
+    
+    def close(self):
+        pass
+    
+    def abort(self):
+        pass
+
+
+class _GatedFile:
+    """Envuelve el archivo de grabación; write espera hasta que se abre la compuerta"""
+    
+    def __init__(self, real_file, gate: threading.Event, writing: threading.Event):
+        self._file = real_file
+        self._gate = gate
+        self._writing = writing
+        self.name = real_file.name
+    
+    def write(self, data):
+        self._writing.set()
+        self._gate.wait()
+        self._file.write(data)
+    
+    def close(self):
+        self._file.close()
+
+
+class RecordingRingTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.output = str(Path(self._tmp.name) / "rec.wav")
+        patcher = mock.patch.object(audio_engine.sd, "InputStream", _FakeInputStream)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.engine = _SmallRingEngine()
+    
+    def tearDown(self):
+        self.engine.cleanup()
+        self._tmp.cleanup()
+    
+    def _block(self, value: float) -> "np.ndarray":
+        shape = (AudioEngine.RECORDING_BLOCK_SIZE, AudioEngine.RECORDING_CHANNELS)
+        return np.full(shape, value, dtype=np.float32)
+    
+    def test_blocks_are_written_in_order(self):
+        self.engine.start_recording(self.output, subtype="FLOAT")
+        callback = self.engine._rec_stream.callback
+        
+        values = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7]  # más bloques que slots
+        for value in values:
+            callback(self._block(value), AudioEngine.RECORDING_BLOCK_SIZE, None, None)
+            # Dejar que el escritor libere el slot antes del siguiente
+            while self.engine._rec_rd < self.engine._rec_wr:
+                time.sleep(0.001)
+        
+        self.engine.stop_recording()
+        
+        samples, _ = sf.read(self.output, dtype="float32", always_2d=True)
+        block = AudioEngine.RECORDING_BLOCK_SIZE
+        self.assertEqual(len(samples), block * len(values))
+        for i, value in enumerate(values):
+            np.testing.assert_allclose(samples[i * block:(i + 1) * block], value)
+    
+    def test_full_ring_drops_blocks_and_warns(self):
+        gate, writing = threading.Event(), threading.Event()
+        real_soundfile = sf.SoundFile
+        with mock.patch.object(
+            audio_engine.sf, "SoundFile",
+            lambda *args, **kwargs: _GatedFile(real_soundfile(*args, **kwargs), gate, writing)
+        ):
+            self.engine.start_recording(self.output, subtype="FLOAT")
+        callback = self.engine._rec_stream.callback
+        frames = AudioEngine.RECORDING_BLOCK_SIZE
+        
+        # El primer bloque queda retenido en write: el escritor no avanza
+        callback(self._block(0.0), frames, None, None)
+        self.assertTrue(writing.wait(5))
+        
+        # 4 slots: entran 3 más, los 2 siguientes se pierden
+        for value in (0.1, 0.2, 0.3, 0.4, 0.5):
+            callback(self._block(value), frames, None, None)
+        self.assertEqual(self.engine._rec_dropped, 2)
+        
+        gate.set()
+        with self.assertLogs(audio_engine.log, "WARNING") as logs:
+            self.engine.stop_recording()
+        self.assertIn("dropped 2 blocks", logs.output[0])
+        
+        samples, _ = sf.read(self.output, dtype="float32", always_2d=True)
+        self.assertEqual(len(samples), frames * 4)
+    
+    def test_callback_status_is_reported(self):
+        self.engine.start_recording(self.output, subtype="FLOAT")
+        callback = self.engine._rec_stream.callback
+        
+        callback(self._block(0.0), AudioEngine.RECORDING_BLOCK_SIZE, None, "input overflow")
+        
+        with self.assertLogs(audio_engine.log, "WARNING") as logs:
+            self.engine.stop_recording()
+        self.assertTrue(any("input overflow" in line for line in logs.output))
+
+
+if __name__ == "__main__":
+    unittest.main()
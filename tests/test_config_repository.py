@@ -0,0 +1,146 @@
+"""
+Tests de ConfigRepository: guardado por shards, nombres de categoría
+y guardado diferido
+"""
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pulseboard.persistence.config_repository import ConfigRepository
+
+
+def _sound(sound_id: str, category: str) -> dict:
+    return {
+        "id": sound_id,
+        "name": sound_id,
+        "file_path": f"{sound_id}.wav",
+        "category": category,
+        "volume": 1.0,
+        "loop": False,
+        "hotkey": "",
+        "image_path": None,
+        "effects": [],
+    }
+
+
+class ConfigRepositoryShardTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = self._tmp.name
+        self.repo = ConfigRepository(self.base_dir)
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def test_category_name_with_slash_round_trips(self):
+        data = {
+            "categories": ["General", "AC/DC"],
+            "sounds": [_sound("a", "General"), _sound("b", "AC/DC")],
+        }
+        
+        self.repo.save(data)
+        
+        # Ningún shard fuera de categories/ ni subcarpetas
+        for path in self.repo.categories_dir.iterdir():
+            self.assertTrue(path.is_file())
+        
+        loaded = ConfigRepository(self.base_dir).load()
+        self.assertEqual(loaded["categories"], ["General", "AC/DC"])
+        self.assertEqual([s["id"] for s in loaded["sounds"]], ["a", "b"])
+        self.assertEqual(loaded["sounds"][1]["category"], "AC/DC")
+    
+    def test_names_differing_only_in_case_use_different_files(self):
+        self.assertNotEqual(
+            self.repo._shard_path("Memes").name.lower(),
+            self.repo._shard_path("memes").name.lower()
+        )
+    
+    def test_index_without_shard_ids_is_migrated(self):
+        # Índice escrito por una versión que nombraba shards por categoría
+        categories_dir = Path(self.repo.categories_dir)
+        (categories_dir / "General.json").write_text(
+            json.dumps({"sounds": [_sound("a", "General")]}), encoding="utf-8")
+        self.repo.index_file.write_text(
+            json.dumps({"categories": ["General"]}), encoding="utf-8")
+        
+        repo = ConfigRepository(self.base_dir)
+        data = repo.load()
+        self.assertEqual([s["id"] for s in data["sounds"]], ["a"])
+        
+        repo.save(data)
+        
+        self.assertFalse((categories_dir / "General.json").exists())
+        index = json.loads(self.repo.index_file.read_text(encoding="utf-8"))
+        self.assertIn("General", index["shards"])
+        self.assertEqual(ConfigRepository(self.base_dir).load()["sounds"][0]["id"], "a")
+
+
+class ConfigRepositoryDeferredSaveTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.base_dir = self._tmp.name
+        self.repo = ConfigRepository(self.base_dir)
+        self.repo.SAVE_DELAY = 0.05
+    
+    def tearDown(self):
+        self.repo.close()
+        self._tmp.cleanup()
+    
+    def _data(self, *sound_ids: str) -> dict:
+        return {
+            "categories": ["General"],
+            "sounds": [_sound(sound_id, "General") for sound_id in sound_ids],
+        }
+    
+    def _loaded_ids(self) -> list:
+        loaded = ConfigRepository(self.base_dir).load()
+        return [s["id"] for s in loaded["sounds"]] if loaded else None
+    
+    def test_consecutive_saves_are_written_once_with_the_last_state(self):
+        with mock.patch.object(self.repo, "save", wraps=self.repo.save) as save:
+            self.repo.schedule_save(self._data("a"))
+            self.repo.schedule_save(self._data("a", "b"))
+            
+            deadline = time.monotonic() + 5
+            while not save.called and time.monotonic() < deadline:
+                time.sleep(0.01)
+            time.sleep(self.repo.SAVE_DELAY * 2)
+        
+        self.assertEqual(save.call_count, 1)
+        self.assertEqual(self._loaded_ids(), ["a", "b"])
+    
+    def test_flush_writes_pending_save_immediately(self):
+        self.repo.SAVE_DELAY = 60
+        self.repo.schedule_save(self._data("a"))
+        self.assertIsNone(self._loaded_ids())
+        
+        self.repo.flush()
+        
+        self.assertEqual(self._loaded_ids(), ["a"])
+    
+    def test_flush_without_pending_save_does_not_write(self):
+        self.repo.SAVE_DELAY = 60
+        self.repo.schedule_save(self._data("a"))
+        self.repo.flush()
+        
+        with mock.patch.object(self.repo, "save") as save:
+            self.repo.flush()
+        
+        save.assert_not_called()
+    
+    def test_saves_after_close_are_written_synchronously(self):
+        self.repo.close()
+        
+        self.repo.schedule_save(self._data("a"))
+        
+        self.assertIsNone(self.repo._save_timer)
+        self.assertEqual(self._loaded_ids(), ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
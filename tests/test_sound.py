@@ -0,0 +1,56 @@
+"""
+Tests de Sound: serialización cacheada
+"""
+import unittest
+
+from pulseboard.domain.sound import Sound
+from pulseboard.domain.soundboard import Soundboard
+
+
+class SoundToDictTest(unittest.TestCase):
+    
+    def setUp(self):
+        self.sound = Sound(id="a", name="Clap", file_path="clap.wav", category="General")
+    
+    def test_to_dict_returns_a_copy(self):
+        data = self.sound.to_dict()
+        data["name"] = "Changed"
+        data["effects"].append("pitch_high")
+        
+        self.assertEqual(self.sound.to_dict()["name"], "Clap")
+        self.assertEqual(self.sound.to_dict()["effects"], [])
+    
+    def test_shared_dict_is_reused_while_unchanged(self):
+        self.assertIs(self.sound._shared_dict(), self.sound._shared_dict())
+    
+    def test_mutators_invalidate_the_cached_dict(self):
+        mutations = [
+            (lambda s: s.set_volume(0.5), "volume", 0.5),
+            (lambda s: s.toggle_loop(), "loop", True),
+            (lambda s: s.assign_hotkey("q"), "hotkey", "Q"),
+            (lambda s: s.set_image("clap.png"), "image_path", "clap.png"),
+            (lambda s: s.rename("Snap"), "name", "Snap"),
+            (lambda s: s.set_file_path("snap.wav"), "file_path", "snap.wav"),
+            (lambda s: s.set_category("Memes"), "category", "Memes"),
+            (lambda s: s.add_effect("slowed"), "effects", ["slowed"]),
+            (lambda s: s.clear_effects(), "effects", []),
+        ]
+        for mutate, field, expected in mutations:
+            with self.subTest(field=field):
+                before = self.sound._shared_dict()
+                mutate(self.sound)
+                after = self.sound._shared_dict()
+                self.assertIsNot(before, after)
+                self.assertEqual(after[field], expected)
+                self.assertEqual(self.sound.to_dict()[field], expected)
+    
+    def test_snapshot_shares_cached_dicts(self):
+        board = Soundboard()
+        board.add_sound(self.sound)
+        
+        self.assertIs(board.snapshot()["sounds"][0], self.sound._shared_dict())
+        self.assertIsNot(board.to_dict()["sounds"][0], self.sound._shared_dict())
+
+
+if __name__ == "__main__":
+    unittest.main()
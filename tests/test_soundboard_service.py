@@ -0,0 +1,133 @@
+"""
+Tests de SoundboardService: detección de duplicados al importar y
+caché de resultados de efectos
+"""
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+try:
+    from pulseboard.application import commands
+    from pulseboard.application.soundboard_service import SoundboardService
+except ImportError as e:  # pygame, sounddevice, soundfile...
+    raise unittest.SkipTest(f"audio dependencies not installed: {e}")
+
+from pulseboard.domain.soundboard import Soundboard
+from pulseboard.persistence.config_repository import ConfigRepository
+
+
+class _RecordingEngine:
+    """Motor de audio mínimo: solo registra lo que se carga"""
+    
+    def __init__(self):
+        self.loaded = {}
+    
+    def load_sound(self, sound_id, file_path):
+        self.loaded[sound_id] = file_path
+    
+    def unload_sound(self, sound_id):
+        self.loaded.pop(sound_id, None)
+
+
+class AddSoundDuplicateTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.repo = ConfigRepository(str(self.tmp))
+        self.service = SoundboardService(Soundboard(), _RecordingEngine(), self.repo)
+    
+    def tearDown(self):
+        self.service.flush(final=True)
+        self._tmp.cleanup()
+    
+    def _write(self, name: str, payload: bytes) -> str:
+        path = self.tmp / name
+        path.write_bytes(payload)
+        return str(path)
+    
+    def test_same_file_reuses_sound_and_applies_settings(self):
+        path = self._write("clip.wav", os.urandom(4096))
+        first = self.service.handle(commands.AddSoundFromFile(path, "General"))
+        
+        second = self.service.handle(
+            commands.AddSoundFromFile(path, "General", hotkey="q", volume=0.25))
+        
+        self.assertEqual(first, second)
+        sound = self.service.soundboard.get_sound(first)
+        self.assertEqual(sound.hotkey, "Q")
+        self.assertEqual(sound.volume, 0.25)
+        self.assertEqual(len(self.service.get_all_sounds()), 1)
+    
+    def test_fingerprint_collision_is_not_a_duplicate(self):
+        # Mismo tamaño, mismos primeros y últimos 64 KB, distinto medio
+        chunk = ConfigRepository.FINGERPRINT_CHUNK
+        head, tail = os.urandom(chunk), os.urandom(chunk)
+        a = self._write("take_a.wav", head + b"\x00" * 1024 + tail)
+        b = self._write("take_b.wav", head + b"\x01" * 1024 + tail)
+        self.assertEqual(self.repo.fingerprint(a), self.repo.fingerprint(b))
+        
+        first = self.service.handle(commands.AddSoundFromFile(a, "General"))
+        second = self.service.handle(commands.AddSoundFromFile(b, "General"))
+        
+        self.assertNotEqual(first, second)
+        stored = self.service.soundboard.get_sound(second).file_path
+        self.assertEqual(Path(stored).read_bytes(), Path(b).read_bytes())
+
+
+class EffectResultCacheTest(unittest.TestCase):
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.repo = ConfigRepository(str(self.tmp))
+        self.service = SoundboardService(Soundboard(), _RecordingEngine(), self.repo)
+        
+        self.source = self.tmp / "clip.wav"
+        self.source.write_bytes(b"source" * 100)
+        self.output = self.tmp / "clip_pitch_high.wav"
+        self.output.write_bytes(b"processed" * 100)
+    
+    def tearDown(self):
+        self.service.flush(final=True)
+        self._tmp.cleanup()
+    
+    def _key(self):
+        return self.service._effect_result_key(str(self.source), "pitch_high", {})
+    
+    def test_unchanged_source_reuses_the_output(self):
+        self.service._remember_effect_result(self._key(), self.output)
+        copy_path = self.tmp / "copy_pitch_high.wav"
+        
+        self.assertTrue(self.service._reuse_effect_result(self._key(), copy_path))
+        self.assertEqual(copy_path.read_bytes(), self.output.read_bytes())
+    
+    def test_rewritten_source_gets_a_new_key(self):
+        key = self._key()
+        self.service._remember_effect_result(key, self.output)
+        
+        self.source.write_bytes(b"another take" * 100)
+        
+        self.assertNotEqual(self._key(), key)
+        self.assertFalse(
+            self.service._reuse_effect_result(self._key(), self.tmp / "new.wav"))
+    
+    def test_modified_output_is_not_reused(self):
+        key = self._key()
+        self.service._remember_effect_result(key, self.output)
+        
+        self.output.write_bytes(b"edited by hand")
+        
+        self.assertFalse(self.service._reuse_effect_result(key, self.tmp / "copy.wav"))
+        self.assertNotIn(key, self.service._effect_results)
+    
+    def test_different_parameters_do_not_share_results(self):
+        self.assertNotEqual(
+            self.service._effect_result_key(str(self.source), "speed", {"factor": 1.5}),
+            self.service._effect_result_key(str(self.source), "speed", {"factor": 0.5})
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
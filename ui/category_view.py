@@ -24,6 +24,12 @@ class CategoryView(ctk.CTkFrame):
         self.main_window = main_window
         self.visible = True
         
+        # Ruta de la carpeta, resuelta una vez
+        self._folder_path = os.path.join(
+            controller.soundboard_service.config_repo.sound_folder,
+            category_name
+        )
+        
         self._build_ui()
     
     def _build_ui(self):
@@ -89,10 +95,7 @@ class CategoryView(ctk.CTkFrame):
     
     def _open_folder(self):
         """Abre la carpeta de la categoría"""
-        path = os.path.join(
-            self.controller.soundboard_service.config_repo.sound_folder,
-            self.category_name
-        )
+        path = self._folder_path
         
         if os.path.exists(path):
             os.startfile(path)
@@ -4,23 +4,30 @@ Inspirada en el diseño de index.html
 """
 import customtkinter as ctk
 from customtkinter import CTkFont
+from tkinter import filedialog, messagebox, simpledialog
 import ctypes
+import logging
 import os
+import queue
 import sys
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from pulseboard.ui.category_view import CategoryView
 from pulseboard.ui.sound_card import SoundCard
 from pulseboard.controller.soundboard_controller import SoundboardController
 
 
+log = logging.getLogger(__name__)
+
+
+# Base de recursos: carpeta temporal del exe (PyInstaller) o el directorio actual
+_BASE_PATH = getattr(sys, '_MEIPASS', None) or os.path.abspath(".")
+
+
 def resource_path(relative_path):
     """Obtiene la ruta absoluta para archivos, incluso dentro del exe"""
-    try:
-        base_path = sys._MEIPASS
-    except AttributeError:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 
 def load_font_windows(ttf_path):
@@ -28,13 +35,13 @@ def load_font_windows(ttf_path):
     try:
         path = resource_path(ttf_path)
         if not os.path.exists(path):
-            print(f"⚠️ Font not found: {path}, using system default")
+            log.warning("Font not found: %s, using system default", path)
             return False
         FR_PRIVATE = 0x10
         ctypes.windll.gdi32.AddFontResourceExW(path, FR_PRIVATE, 0)
         return True
     except Exception as e:
-        print(f"⚠️ Failed to load font {ttf_path}: {e}")
+        log.warning("Failed to load font %s: %s", ttf_path, e)
         return False
 
 
@@ -54,6 +61,9 @@ class MainWindow(ctk.CTk):
     WARNING = "#fbbf24"
     DANGER = "#ef4444"
     
+    VIEWPORT_MARGIN = 200  # px fuera de pantalla que igual se construyen
+    UI_QUEUE_POLL_MS = 30  # cada cuánto se vacía la cola de resultados del pool
+    
     def __init__(self, controller: SoundboardController, fonts_folder: str):
         super().__init__()
         
@@ -79,10 +89,21 @@ class MainWindow(ctk.CTk):
         self.font_main_bold = CTkFont("Rajdhani", 13, "bold")
         self.font_small = CTkFont("Rajdhani", 10)
         self.font_footer = CTkFont("Orbitron", 8)
+        self.font_emoji_large = CTkFont("Segoe UI Emoji", 32)
+        self.font_emoji = CTkFont("Segoe UI Emoji", 20)
         
         # Estado
         self.category_views: Dict[str, CategoryView] = {}
         self.sound_cards: Dict[str, SoundCard] = {}
+        self._categories_cache: Optional[List[str]] = None  # se invalida por observers
+        self._viewport_scan_pending = False
+        self._hotkey_popup = None  # se crea al primer uso y se reutiliza
+        
+        # Lecturas de disco de la UI (imágenes) fuera del hilo de Tk
+        self.io_pool = ThreadPoolExecutor(max_workers=4)
+        # Resultados del pool: Tk no admite llamadas desde otros hilos,
+        # así que se encolan y se procesan en _drain_ui_queue
+        self._ui_queue: queue.Queue = queue.Queue()
         
         # Construir UI
         self._build_ui()
@@ -92,6 +113,26 @@ class MainWindow(ctk.CTk):
         
         # Cargar contenido inicial
         self._load_initial_content()
+        
+        self.after(self.UI_QUEUE_POLL_MS, self._drain_ui_queue)
+    
+    def post_to_ui(self, callback, *args) -> None:
+        """Pide ejecutar callback(*args) en el hilo de Tk (seguro desde cualquier hilo)"""
+        self._ui_queue.put((callback, args))
+    
+    def _drain_ui_queue(self):
+        """Ejecuta lo encolado por otros hilos y vuelve a programarse"""
+        while True:
+            try:
+                callback, args = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception:
+                log.exception("UI callback %r failed", callback)
+        
+        self.after(self.UI_QUEUE_POLL_MS, self._drain_ui_queue)
     
     def _build_ui(self):
         """Construye la interfaz"""
@@ -110,6 +151,7 @@ class MainWindow(ctk.CTk):
             fg_color=self.BG_MAIN
         )
         self.scroll_container.pack(fill="both", expand=True, padx=10, pady=10)
+        self._bind_viewport_events()
         
         # Footer
         self._build_footer()
@@ -133,7 +175,7 @@ class MainWindow(ctk.CTk):
         icon_label = ctk.CTkLabel(
             title_frame,
             text=":D",
-            font=CTkFont("Segoe UI Emoji", 32),
+            font=self.font_emoji_large,
             text_color=self.ACCENT
         )
         icon_label.pack(side="left", padx=(0, 10))
@@ -150,7 +192,7 @@ class MainWindow(ctk.CTk):
         settings_btn = ctk.CTkButton(
             header,
             text="⚙️",
-            font=CTkFont("Segoe UI Emoji", 20),
+            font=self.font_emoji,
             width=50,
             height=50,
             fg_color=self.BG_LIGHTER,
@@ -282,21 +324,16 @@ class MainWindow(ctk.CTk):
     
     def _create_category(self):
         """Crea una nueva categoría"""
-        from tkinter import simpledialog
-        
         name = simpledialog.askstring("Nueva Carpeta", "Nombre de la carpeta:")
         if name:
             try:
                 self.controller.create_category(name)
             except Exception as e:
-                from tkinter import messagebox
                 messagebox.showerror("Error", str(e))
     
     def _add_sound(self):
         """Agrega un sonido desde archivo"""
-        from tkinter import filedialog, messagebox
-        
-        categories = self.controller.get_categories()
+        categories = self._get_categories()
         if not categories:
             messagebox.showerror("Error", "Crea una carpeta primero")
             return
@@ -331,13 +368,11 @@ class MainWindow(ctk.CTk):
                     text_color=self.DANGER
                 )
             except Exception as e:
-                from tkinter import messagebox
                 messagebox.showerror("Error", str(e))
         else:
             # Iniciar
-            categories = self.controller.get_categories()
+            categories = self._get_categories()
             if not categories:
-                from tkinter import messagebox
                 messagebox.showerror("Error", "Crea una carpeta primero")
                 return
             
@@ -357,20 +392,16 @@ class MainWindow(ctk.CTk):
                     text_color=self.SUCCESS
                 )
             except Exception as e:
-                from tkinter import messagebox
                 messagebox.showerror("Error", str(e))
     
     def _show_settings(self):
         """Muestra ventana de configuración"""
         # TODO: Implementar
-        from tkinter import messagebox
         messagebox.showinfo("Configuración", "Próximamente...")
     
     def _select_category_dialog(self, title: str) -> str:
         """Muestra diálogo para seleccionar categoría"""
-        from tkinter import simpledialog
-        
-        categories = self.controller.get_categories()
+        categories = self._get_categories()
         
         # Crear popup
         popup = ctk.CTkToplevel(self)
@@ -415,17 +446,84 @@ class MainWindow(ctk.CTk):
         self.wait_window(popup)
         return selected[0]
     
+    def prompt_hotkey(self, sound_id: str):
+        """
+        Pide una tecla para el sonido con un único popup que se oculta
+        (withdraw) en lugar de destruirse entre usos.
+        """
+        popup = self._hotkey_popup
+        if popup is None or not popup.winfo_exists():
+            popup = self._hotkey_popup = self._build_hotkey_popup()
+        
+        def capture(e):
+            key = e.keysym.upper()
+            self._close_hotkey_popup()
+            
+            if not self.controller.assign_hotkey(sound_id, key):
+                messagebox.showerror("Error", "Tecla en uso")
+        
+        popup.bind("<KeyPress>", capture)
+        popup.deiconify()
+        popup.lift()
+        popup.focus_force()
+        popup.grab_set()
+    
+    def _build_hotkey_popup(self):
+        popup = ctk.CTkToplevel(self)
+        popup.title("Asignar Tecla")
+        popup.geometry("300x150")
+        popup.transient(self)
+        popup.configure(fg_color=self.BG_MAIN)
+        popup.protocol("WM_DELETE_WINDOW", self._close_hotkey_popup)
+        
+        ctk.CTkLabel(
+            popup,
+            text="Presiona una tecla",
+            font=self.font_subtitle,
+            text_color=self.ACCENT
+        ).pack(expand=True)
+        
+        return popup
+    
+    def _close_hotkey_popup(self):
+        popup = self._hotkey_popup
+        popup.grab_release()
+        popup.unbind("<KeyPress>")
+        popup.withdraw()
+    
     # ==================== OBSERVERS ====================
     
     def _setup_observers(self):
         """Registra observers en el controller"""
-        self.controller.on_sound_added(self._on_sound_added)
-        self.controller.on_sound_removed(self._on_sound_removed)
-        self.controller.on_sound_updated(self._on_sound_updated)
+        self.controller.on_sounds_added(self._on_sounds_added)
+        self.controller.on_sounds_removed(self._on_sounds_removed)
+        self.controller.on_sound_changed(self._on_sound_updated)
         self.controller.on_category_created(self._on_category_created)
     
-    def _on_sound_added(self, sound):
-        """Handler cuando se agrega un sonido"""
+    def _on_sounds_added(self, sounds):
+        """
+        Handler cuando se agregan sonidos (uno o un lote).
+        Crea todas las cards y recién después las empaqueta, con un solo
+        cálculo de layout al final.
+        """
+        # Un sonido puede traer una categoría nueva
+        self._categories_cache = None
+        
+        cards = [card for card in map(self._build_sound_card, sounds) if card]
+        if not cards:
+            return
+        
+        for sound_card in cards:
+            sound_card.pack(fill="x", pady=6)
+        
+        self.update_idletasks()
+        self._schedule_viewport_scan()
+    
+    def _build_sound_card(self, sound):
+        """Crea (sin empaquetar) la card de un sonido; None si ya existe"""
+        if sound.id in self.sound_cards:
+            return None
+        
         # Obtener o crear category view
         if sound.category not in self.category_views:
             self._create_category_view(sound.category)
@@ -439,9 +537,17 @@ class MainWindow(ctk.CTk):
             self.controller,
             self
         )
-        sound_card.pack(fill="x", pady=6)
         
         self.sound_cards[sound.id] = sound_card
+        return sound_card
+    
+    def _on_sounds_removed(self, sound_ids):
+        """Handler cuando se eliminan sonidos (uno o un lote)"""
+        # Al borrar una categoría se eliminan sus sonidos
+        self._categories_cache = None
+        
+        for sound_id in sound_ids:
+            self._on_sound_removed(sound_id)
     
     def _on_sound_removed(self, sound_id):
         """Handler cuando se elimina un sonido"""
@@ -449,16 +555,86 @@ class MainWindow(ctk.CTk):
             self.sound_cards[sound_id].destroy()
             del self.sound_cards[sound_id]
     
-    def _on_sound_updated(self, sound):
+    def _on_sound_updated(self, sound, event=None):
         """Handler cuando se actualiza un sonido"""
-        if sound.id in self.sound_cards:
-            self.sound_cards[sound.id].update_from_sound(sound)
+        card = self.sound_cards.get(sound.id)
+        if card is None:
+            return
+        
+        if event is None:
+            card.update_from_sound(sound)
+        else:
+            card.apply(event)
     
     def _on_category_created(self, category):
         """Handler cuando se crea una categoría"""
+        self._categories_cache = None
         self._create_category_view(category)
     
     # ==================== CONTENT ====================
+
+    def _bind_viewport_events(self):
+        """Re-escanea las cards visibles al hacer scroll o cambiar el layout"""
+        # Canvas y scrollbar internos de CTkScrollableFrame (atributos
+        # privados): si una versión de customtkinter no los tiene, no hay
+        # culling y _scan_viewport construye todas las cards
+        self._viewport_canvas = getattr(self.scroll_container, "_parent_canvas", None)
+        if self._viewport_canvas is None:
+            log.warning("CTkScrollableFrame without _parent_canvas: building every sound card")
+            return
+        
+        self._viewport_canvas.bind("<Configure>", self._schedule_viewport_scan, add="+")
+        self.scroll_container.bind("<Configure>", self._schedule_viewport_scan, add="+")
+        scrollbar = getattr(self.scroll_container, "_scrollbar", None)
+        if scrollbar is not None:
+            scrollbar.bind("<B1-Motion>", self._schedule_viewport_scan, add="+")
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind_all(sequence, self._schedule_viewport_scan, add="+")
+    
+    def _schedule_viewport_scan(self, event=None):
+        """Agrupa los eventos de scroll en un solo escaneo por ciclo idle"""
+        if self._viewport_scan_pending:
+            return
+        self._viewport_scan_pending = True
+        self.after_idle(self._scan_viewport)
+    
+    def _scan_viewport(self):
+        """
+        Construye las cards que entraron en pantalla (más un margen) y marca
+        como ocultas las que salieron, para que no procesen updates.
+        """
+        self._viewport_scan_pending = False
+        
+        canvas = self._viewport_canvas
+        if canvas is None:
+            for card in self.sound_cards.values():
+                card.reveal()
+            return
+        
+        top = canvas.canvasy(0) - self.VIEWPORT_MARGIN
+        bottom = canvas.canvasy(canvas.winfo_height()) + self.VIEWPORT_MARGIN
+        origin = self.scroll_container.winfo_rooty()
+        
+        built = False
+        for card in self.sound_cards.values():
+            # Posición dentro del frame scrollable (independiente del scroll)
+            y = card.winfo_rooty() - origin
+            if card.winfo_ismapped() and y + card.winfo_height() >= top and y <= bottom:
+                built |= not card.is_built
+                card.reveal()
+            else:
+                card.conceal()
+        
+        # Las cards recién construidas cambian de alto: volver a medir
+        if built:
+            self._schedule_viewport_scan()
+    
+    
+    def _get_categories(self) -> List[str]:
+        """Categorías del controller, cacheadas hasta el próximo cambio"""
+        if self._categories_cache is None:
+            self._categories_cache = self.controller.get_categories()
+        return self._categories_cache
     
     def _load_initial_content(self):
         """Carga el contenido inicial"""
@@ -467,8 +643,7 @@ class MainWindow(ctk.CTk):
             self._create_category_view(category)
         
         # Crear cards de sonidos
-        for sound in self.controller.get_all_sounds():
-            self._on_sound_added(sound)
+        self._on_sounds_added(self.controller.get_all_sounds())
     
     def _create_category_view(self, category: str):
         """Crea una vista de categoría"""
@@ -3,20 +3,76 @@ Componente visual de una tarjeta de sonido
 Diseño pixel art / retro
 """
 import customtkinter as ctk
-from tkinter import filedialog, messagebox
-from PIL import Image
+import tkinter as tk
+from tkinter import TclError, filedialog, messagebox
+import logging
+import os
+from collections import OrderedDict
+from functools import partial
+from PIL import Image, ImageDraw, ImageFont
 from pathlib import Path
 
 from pulseboard.domain.sound import Sound
+from pulseboard.application import events
 from pulseboard.controller.soundboard_controller import SoundboardController
 
 
+log = logging.getLogger(__name__)
+
+
+# ==================== GLYPHS ====================
+
+EMOJI_FONT_FILE = "seguiemj.ttf"  # Segoe UI Emoji (PIL la busca en las fuentes del sistema)
+
+# (caracter, tamaño, color) -> CTkImage, o None si no hay fuente emoji
+_GLYPHS = {}
+
+
+def _render_glyph(char: str, size: int, color: str):
+    """
+    Dibuja un emoji una sola vez con PIL y lo devuelve como CTkImage,
+    para no pedirle a Tk que dé forma a la fuente emoji en cada card.
+    Monocromo en el color del widget, como lo dibujaba Tk.
+    """
+    key = (char, size, color)
+    if key not in _GLYPHS:
+        try:
+            font = ImageFont.truetype(EMOJI_FONT_FILE, size)
+        except OSError:
+            _GLYPHS[key] = None
+        else:
+            left, top, right, bottom = font.getbbox(char)
+            img = Image.new("RGBA", (right - left, bottom - top), (0, 0, 0, 0))
+            ImageDraw.Draw(img).text((-left, -top), char, font=font, fill=color)
+            _GLYPHS[key] = ctk.CTkImage(dark_image=img, size=img.size)
+    return _GLYPHS[key]
+
+
+def _glyph_options(char: str, size: int, color: str, font) -> dict:
+    """Opciones de widget: imagen pre-renderizada o, si no se pudo, texto"""
+    glyph = _render_glyph(char, size, color)
+    if glyph is None:
+        return {"text": char, "font": font}
+    return {"text": "", "image": glyph}
+
+
 class SoundCard(ctk.CTkFrame):
     """
     Tarjeta visual de un sonido.
     Muestra info, controles de reproducción, volumen, etc.
     """
     
+    IMAGE_SIZE = (60, 60)
+    PLACEHOLDER_HEIGHT = 190  # alto aproximado de una card aún sin construir
+    VOLUME_FLUSH_MS = 16      # como mucho un set_volume por frame al arrastrar
+    MAX_CACHED_IMAGES = 128   # CTkImage compartidas entre cards (LRU)
+    
+    # (ruta, mtime) -> CTkImage, compartido por todas las cards
+    _image_cache = OrderedDict()
+    
+    # ruta -> Future de la decodificación en curso (una sola por ruta)
+    _pending_decodes = {}
+    
     def __init__(
         self,
         parent,
@@ -29,278 +85,261 @@ class SoundCard(ctk.CTkFrame):
             fg_color=main_window.BG_CARD,
             border_width=2,
             border_color=main_window.ACCENT_DIM,
-            corner_radius=0
+            corner_radius=0,
+            height=self.PLACEHOLDER_HEIGHT
         )
         
         self.sound = sound
         self.controller = controller
         self.main_window = main_window
+        self._image_path = None  # imagen mostrada (o pedida) actualmente
+        self._applied = {}       # (widget, opción) -> último valor configurado
+        
+        # El contenido se construye recién cuando la card entra en pantalla
+        # (MainWindow llama a reveal/conceal al hacer scroll)
+        self._built = False
+        self._visible = False
+        self._dirty = False      # cambios recibidos mientras estaba oculta
+        
+        # Evento del controller -> actualización puntual (ver apply)
+        self._event_handlers = {
+            events.VolumeChanged: self._apply_volume,
+            events.LoopToggled: self._apply_loop,
+            events.HotkeyAssigned: self._apply_hotkey,
+            events.ImageSet: self._apply_image,
+            events.SoundRenamed: self._apply_name,
+        }
+        
+        self._pending_updates = None  # handlers a aplicar en el próximo idle
         
-        self._build_ui()
+        self._pending_volume = None   # último volumen pedido, sin enviar
+        self._volume_flush_id = None
+    
+    # ==================== VIEWPORT ====================
+    
+    def reveal(self):
+        """La card entró en pantalla: construye o aplica cambios pendientes"""
+        self._visible = True
+        
+        if not self._built:
+            self._built = True
+            self._build_ui()
+        elif self._dirty:
+            self._refresh()
+    
+    def conceal(self):
+        """La card salió de pantalla: los cambios se aplican al volver"""
+        self._visible = False
+    
+    @property
+    def is_built(self) -> bool:
+        return self._built
     
     def _build_ui(self):
-        """Construye la interfaz de la tarjeta"""
-        # Contenedor principal con padding
-        content = ctk.CTkFrame(self, fg_color="transparent")
-        content.pack(fill="x", padx=8, pady=8)
+        """
+        Construye la interfaz de la tarjeta.
+        Un solo grid sobre la card (sin frames intermedios de layout):
+        
+            imagen | nombre  | eq
+            imagen | estado  | eq
+            ------ separador ------
+            [ botones de control ]
+            VOL_LEVEL          xx%
+            [ barra de volumen   ]
+        """
+        # Colores y fuentes de la ventana, leídos como locales
+        mw = self.main_window
         
-        # Fila 1: Imagen + Info + Equalizer
-        top_row = ctk.CTkFrame(content, fg_color="transparent")
-        top_row.pack(fill="x", pady=(0, 10))
+        self.grid_columnconfigure(1, weight=1)
         
-        # Imagen
+        # Fila 1-2: Imagen + Info + Equalizer
         self.image_label = ctk.CTkLabel(
-            top_row,
+            self,
             text="+ IMG",
             width=60,
             height=60,
-            fg_color=self.main_window.BG_LIGHTER,
-            text_color=self.main_window.ACCENT_DIM,
-            font=self.main_window.font_small,
+            fg_color=mw.BG_LIGHTER,
+            text_color=mw.ACCENT_DIM,
+            font=mw.font_small,
             corner_radius=0
         )
-        self.image_label.pack(side="left", padx=(0, 10))
-        self.image_label.bind("<Button-1>", lambda e: self._set_image())
-        
-        # Info (nombre + estado)
-        info_frame = ctk.CTkFrame(top_row, fg_color="transparent")
-        info_frame.pack(side="left", fill="x", expand=True)
+        self.image_label.grid(row=0, column=0, rowspan=2, padx=(8, 10), pady=(8, 10))
+        self.image_label.bind("<Button-1>", self._set_image)
         
         self.name_label = ctk.CTkLabel(
-            info_frame,
+            self,
             text=self.sound.name.upper(),
-            font=self.main_window.font_main_bold,
-            text_color=self.main_window.ACCENT,
+            font=mw.font_main_bold,
+            text_color=mw.ACCENT,
             anchor="w"
         )
-        self.name_label.pack(anchor="w")
+        self.name_label.grid(row=0, column=1, sticky="sw", pady=(8, 0))
         
         status_text = "LOOP" if self.sound.loop else "READY"
         self.status_label = ctk.CTkLabel(
-            info_frame,
+            self,
             text=f"0:00 // {status_text}",
-            font=self.main_window.font_small,
-            text_color=self.main_window.ACCENT_DIM,
+            font=mw.font_small,
+            text_color=mw.ACCENT_DIM,
             anchor="w"
         )
-        self.status_label.pack(anchor="w")
+        self.status_label.grid(row=1, column=1, sticky="nw", pady=(0, 10))
         
         # Equalizer icon
         eq_label = ctk.CTkLabel(
-            top_row,
-            text="📶",
-            font=ctk.CTkFont("Segoe UI Emoji", 32),
-            text_color=self.main_window.ACCENT_DIM
+            self,
+            text_color=mw.ACCENT_DIM,
+            **_glyph_options("📶", 32, mw.ACCENT_DIM, mw.font_emoji_large)
         )
-        eq_label.pack(side="right", padx=(10, 0))
+        eq_label.grid(row=0, column=2, rowspan=2, padx=(10, 8), pady=(8, 10))
         
         # Separador
         separator = ctk.CTkFrame(
-            content,
+            self,
             height=2,
-            fg_color=self.main_window.ACCENT_DIM,
+            fg_color=mw.ACCENT_DIM,
             corner_radius=0
         )
-        separator.pack(fill="x", pady=10)
-        
-        # Fila 2: Botones de control
-        controls = ctk.CTkFrame(content, fg_color="transparent")
-        controls.pack(fill="x", pady=(0, 10))
-        
-        # Play button
-        play_btn = ctk.CTkButton(
-            controls,
-            text="▸",
-            font=self.main_window.font_main_bold,
-            width=80,
-            height=35,
-            fg_color=self.main_window.BG_LIGHTER,
-            hover_color="#0E4F10",
-            border_width=2,
-            border_color=self.main_window.SUCCESS,
-            text_color=self.main_window.SUCCESS,
-            corner_radius=0,
-            command=self._play
-        )
-        play_btn.pack(side="left", padx=2)
-        
-        # Stop button
-        stop_btn = ctk.CTkButton(
-            controls,
-            text="🟥",
-            font=self.main_window.font_main_bold,
-            width=80,
-            height=35,
-            fg_color=self.main_window.BG_LIGHTER,
-            hover_color="#3E0E4F",
-            border_width=2,
-            border_color=self.main_window.ACCENT,
-            text_color=self.main_window.ACCENT,
-            corner_radius=0,
-            command=self._stop
-        )
-        stop_btn.pack(side="left", padx=2)
-        
-        # Loop button
-        loop_color = self.main_window.SUCCESS if self.sound.loop else self.main_window.ACCENT_DIM
-        self.loop_btn = ctk.CTkButton(
-            controls,
-            text="LOOP",
-            font=self.main_window.font_small,
-            width=70,
-            height=35,
-            fg_color=self.main_window.BG_LIGHTER,
-            hover_color="#112B80",
-            border_width=2,
-            border_color=loop_color,
-            text_color=loop_color,
-            corner_radius=0,
-            command=self._toggle_loop
-        )
-        self.loop_btn.pack(side="left", padx=2)
+        separator.grid(row=2, column=0, columnspan=3, sticky="ew", padx=8, pady=10)
+        
+        # Fila 3: Botones de control (único frame: empaqueta a ambos lados)
+        controls = ctk.CTkFrame(self, fg_color="transparent")
+        controls.grid(row=3, column=0, columnspan=3, sticky="ew", padx=8, pady=(0, 10))
         
-        # Hotkey button
+        # Botones: (opciones de texto/imagen, ancho, hover, color, comando, lado)
+        # Play/stop/loop llaman al controller directamente (el id no cambia)
+        sound_id = self.sound.id
+        loop_color = mw.SUCCESS if self.sound.loop else mw.ACCENT_DIM
         hotkey_text = self.sound.hotkey if self.sound.hotkey else "Tecla"
-        self.hotkey_btn = ctk.CTkButton(
-            controls,
-            text=hotkey_text,
-            font=self.main_window.font_small,
-            width=60,
-            height=35,
-            fg_color=self.main_window.BG_LIGHTER,
-            hover_color="#4D4F0E",
-            border_width=2,
-            border_color=self.main_window.WARNING,
-            text_color=self.main_window.WARNING,
-            corner_radius=0,
-            command=self._assign_hotkey
-        )
-        self.hotkey_btn.pack(side="left", padx=2)
-        
-        # Delete button
-        delete_btn = ctk.CTkButton(
-            controls,
-            text="🗑️",
-            font=self.main_window.font_main_bold,
-            width=50,
-            height=35,
-            fg_color=self.main_window.BG_LIGHTER,
-            hover_color="#4F0E0E",
-            border_width=2,
-            border_color=self.main_window.DANGER,
-            text_color=self.main_window.DANGER,
-            corner_radius=0,
-            command=self._delete
-        )
-        delete_btn.pack(side="right", padx=2)
+        button_specs = [
+            ({"text": "▸", "font": mw.font_main_bold}, 80, "#0E4F10", mw.SUCCESS, partial(self.controller.play_sound, sound_id), "left"),
+            (_glyph_options("🟥", 16, mw.ACCENT, mw.font_main_bold), 80, "#3E0E4F", mw.ACCENT, partial(self.controller.stop_sound, sound_id), "left"),
+            ({"text": "LOOP", "font": mw.font_small}, 70, "#112B80", loop_color, partial(self.controller.toggle_loop, sound_id), "left"),
+            ({"text": hotkey_text, "font": mw.font_small}, 60, "#4D4F0E", mw.WARNING, self._assign_hotkey, "left"),
+            (_glyph_options("🗑️", 16, mw.DANGER, mw.font_main_bold), 50, "#4F0E0E", mw.DANGER, self._delete, "right"),
+        ]
         
-        # Fila 3: Volume control
-        volume_frame = ctk.CTkFrame(content, fg_color="transparent")
-        volume_frame.pack(fill="x")
+        buttons = []
+        for options, width, hover, color, command, side in button_specs:
+            btn = ctk.CTkButton(
+                controls,
+                **options,
+                width=width,
+                height=35,
+                fg_color=mw.BG_LIGHTER,
+                hover_color=hover,
+                border_width=2,
+                border_color=color,
+                text_color=color,
+                corner_radius=0,
+                command=command
+            )
+            btn.pack(side=side, padx=2)
+            buttons.append(btn)
         
-        # Volume label
-        vol_label_frame = ctk.CTkFrame(volume_frame, fg_color="transparent")
-        vol_label_frame.pack(fill="x", pady=(0, 5))
+        # Los que update_from_sound reconfigura
+        self.loop_btn, self.hotkey_btn = buttons[2], buttons[3]
         
+        # Fila 4-5: Volume control
         ctk.CTkLabel(
-            vol_label_frame,
+            self,
             text="VOL_LEVEL",
-            font=self.main_window.font_small,
-            text_color=self.main_window.ACCENT
-        ).pack(side="left")
+            font=mw.font_small,
+            text_color=mw.ACCENT
+        ).grid(row=4, column=0, columnspan=2, sticky="w", padx=(8, 0), pady=(0, 5))
         
         self.volume_percent_label = ctk.CTkLabel(
-            vol_label_frame,
+            self,
             text=f"{int(self.sound.volume * 100)}%",
-            font=self.main_window.font_small,
-            text_color=self.main_window.ACCENT
+            font=mw.font_small,
+            text_color=mw.ACCENT
         )
-        self.volume_percent_label.pack(side="right")
+        self.volume_percent_label.grid(row=4, column=1, columnspan=2, sticky="e", padx=(0, 8), pady=(0, 5))
         
         # Volume bar (pixel style)
-        self._build_volume_bar(volume_frame)
+        self._build_volume_bar(self)
+        self.volume_bar.grid(row=5, column=0, columnspan=3, sticky="ew", padx=8, pady=(2, 8))
         
         # Cargar imagen si existe
         if self.sound.image_path:
             self._load_image(self.sound.image_path)
     
     def _build_volume_bar(self, parent):
-        """Construye una barra de volumen estándar"""
-        self.volume_bar = ctk.CTkProgressBar(
+        """
+        Construye la barra de volumen: un Canvas con un rectángulo de relleno.
+        Sin esquinas redondeadas no hace falta CTkProgressBar, que redibuja
+        la barra entera en cada set(); acá solo se mueven coords.
+        Quien llama la ubica en el layout.
+        """
+        self._volume_bar_height = round(self._apply_widget_scaling(12))
+        self.volume_bar = tk.Canvas(
             parent,
-            orientation="horizontal",
-            height=12,
-            corner_radius=0,
-            fg_color="#000000",
-            progress_color=self.main_window.ACCENT
+            height=self._volume_bar_height,
+            bg="#000000",
+            highlightthickness=0,
+            borderwidth=0
+        )
+        self._volume_fill = self.volume_bar.create_rectangle(
+            0, 0, 0, self._volume_bar_height,
+            fill=self.main_window.ACCENT,
+            width=0
         )
-        self.volume_bar.pack(fill="x", expand=True, pady=(2, 0))
 
-        self.volume_bar.set(self.sound.volume)
+        # Ancho cacheado: evita un winfo_width() (ida y vuelta a Tcl) por evento
+        self._volume_bar_width = 0
+        self.volume_bar.bind("<Configure>", self._on_volume_bar_configure)
 
-        # Click para ajustar volumen
+        # Click (o arrastre) para ajustar volumen
         self.volume_bar.bind("<Button-1>", self._on_volume_click)
+        self.volume_bar.bind("<B1-Motion>", self._on_volume_click)
 
     def _update_volume_visual(self):
-        self.volume_bar.set(self.sound.volume)
+        if self._changed(self.volume_bar, "value", self.sound.volume):
+            self._draw_volume_fill()
+
+    def _draw_volume_fill(self):
+        self.volume_bar.coords(
+            self._volume_fill,
+            0, 0, self._volume_bar_width * self.sound.volume, self._volume_bar_height
+        )
+
+    def _on_volume_bar_configure(self, event):
+        self._volume_bar_width = event.width
+        self._draw_volume_fill()
+
     def _on_volume_click(self, event):
-        width = self.volume_bar.winfo_width()
+        width = self._volume_bar_width
         if width <= 0:
             return
 
         new_volume = event.x / width
         new_volume = max(0.0, min(1.0, new_volume))
 
-        self.controller.set_volume(self.sound.id, new_volume)
+        # Solo se envía el último valor de cada ventana de VOLUME_FLUSH_MS
+        self._pending_volume = new_volume
+        if self._volume_flush_id is None:
+            self._volume_flush_id = self.after(self.VOLUME_FLUSH_MS, self._flush_volume)
+
+    def _flush_volume(self):
+        volume, self._pending_volume = self._pending_volume, None
+        self._volume_flush_id = None
+
+        if volume is not None:
+            self.controller.set_volume(self.sound.id, volume)
     
 
     # ==================== ACTIONS ====================
     
-    def _play(self):
-        """Reproduce el sonido"""
-        self.controller.play_sound(self.sound.id)
-    
-    def _stop(self):
-        """Detiene el sonido"""
-        self.controller.stop_sound(self.sound.id)
-    
-    def _toggle_loop(self):
-        """Alterna el loop"""
-        self.controller.toggle_loop(self.sound.id)
-    
     def _assign_hotkey(self):
         """Asigna un hotkey"""
-        popup = ctk.CTkToplevel(self.main_window)
-        popup.title("Asignar Tecla")
-        popup.geometry("300x150")
-        popup.transient(self.main_window)
-        popup.grab_set()
-        popup.configure(fg_color=self.main_window.BG_MAIN)
-        
-        ctk.CTkLabel(
-            popup,
-            text="Presiona una tecla",
-            font=self.main_window.font_subtitle,
-            text_color=self.main_window.ACCENT
-        ).pack(expand=True)
-        
-        def capture(e):
-            key = e.keysym.upper()
-            success = self.controller.assign_hotkey(self.sound.id, key)
-            
-            if not success:
-                messagebox.showerror("Error", "Tecla en uso")
-            
-            popup.destroy()
-        
-        popup.bind("<KeyPress>", capture)
+        self.main_window.prompt_hotkey(self.sound.id)
     
     def _delete(self):
         """Elimina el sonido"""
         if messagebox.askyesno("Eliminar", "¿Borrar este sonido?"):
             self.controller.delete_sound(self.sound.id, delete_file=True)
     
-    def _set_image(self):
+    def _set_image(self, event=None):
         """Establece la imagen del sonido"""
         file = filedialog.askopenfilename(
             title="Seleccionar imagen",
@@ -310,14 +349,95 @@ class SoundCard(ctk.CTkFrame):
             self.controller.set_sound_image(self.sound.id, file)
     
     def _load_image(self, path: str):
-        """Carga y muestra la imagen"""
+        """
+        Carga la imagen en un hilo del pool de la ventana y la muestra
+        cuando está lista. No hace nada si ya es la imagen actual.
+        """
+        if path == self._image_path:
+            return
+        
+        self._image_path = path
+        
+        # Otra card ya decodificó esta misma imagen: se reutiliza
+        img_tk = self._cached_image(path)
+        if img_tk is not None:
+            self._show_image(img_tk)
+            return
+        
+        # Si otra card ya pidió la misma ruta, se espera esa decodificación
+        future = self._pending_decodes.get(path)
+        if future is None:
+            future = self.main_window.io_pool.submit(self._decode_image, path)
+            self._pending_decodes[path] = future
+            future.add_done_callback(lambda f: self._pending_decodes.pop(path, None))
+        
+        future.add_done_callback(lambda f: self._deliver_image(path, f))
+    
+    @classmethod
+    def _image_key(cls, path: str):
+        """Clave de caché; None si el archivo no existe"""
         try:
-            img = Image.open(path).resize((60, 60))
-            img_tk = ctk.CTkImage(img, img, size=(60, 60))
-            self.image_label.configure(image=img_tk, text="")
-            self.image_label.image = img_tk
+            return path, os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+    
+    @classmethod
+    def _cached_image(cls, path: str):
+        key = cls._image_key(path)
+        img_tk = cls._image_cache.get(key)
+        if img_tk is not None:
+            cls._image_cache.move_to_end(key)
+        return img_tk
+    
+    @classmethod
+    def _remember_image(cls, path: str, img_tk) -> None:
+        key = cls._image_key(path)
+        if key is None:
+            return
+        
+        cls._image_cache[key] = img_tk
+        cls._image_cache.move_to_end(key)
+        while len(cls._image_cache) > cls.MAX_CACHED_IMAGES:
+            cls._image_cache.popitem(last=False)
+    
+    @classmethod
+    def _decode_image(cls, path: str):
+        """Lee y escala la imagen (corre fuera del hilo de Tk)"""
+        return Image.open(path).resize(cls.IMAGE_SIZE)
+    
+    def _deliver_image(self, path: str, future):
+        """
+        Devuelve el resultado del pool al hilo de Tk.
+        Corre en un hilo del pool: no toca widgets, solo encola.
+        """
+        try:
+            img = future.result()
         except Exception as e:
-            print(f"Failed to load image {path}: {e}")
+            log.warning("Failed to load image %s: %s", path, e)
+            return
+        
+        self.main_window.post_to_ui(self.set_image, path, img)
+    
+    def set_image(self, path: str, img):
+        """Muestra una imagen ya decodificada"""
+        # Ignorar resultados viejos o de una card ya destruida
+        if path != self._image_path:
+            return
+        try:
+            if not self.winfo_exists():
+                return
+        except TclError:
+            return
+        
+        # Varias cards pueden recibir la misma decodificación: una sola CTkImage
+        img_tk = self._cached_image(path)
+        if img_tk is None:
+            img_tk = ctk.CTkImage(dark_image=img, size=self.IMAGE_SIZE)
+            self._remember_image(path, img_tk)
+        self._show_image(img_tk)
+    
+    def _show_image(self, img_tk):
+        self.image_label.configure(image=img_tk, text="")
     
     # ==================== UPDATE ====================
     
@@ -325,25 +445,114 @@ class SoundCard(ctk.CTkFrame):
         """Actualiza la UI desde el estado del sonido"""
         self.sound = sound
         
-        # Actualizar nombre
-        self.name_label.configure(text=sound.name.upper())
+        # Sin construir, _build_ui ya parte de self.sound
+        if not self._built:
+            return
         
-        # Actualizar estado
-        status_text = "LOOP" if sound.loop else "READY"
-        self.status_label.configure(text=f"0:00 // {status_text}")
+        if not self._visible:
+            self._dirty = True
+            return
+        
+        self._schedule_update(self._refresh)
+    
+    def apply(self, event):
+        """
+        Aplica un evento puntual (application.events): solo se toca el
+        widget afectado. Eventos desconocidos refrescan la card entera.
+        """
+        if not self._built:
+            return
+        
+        if not self._visible:
+            self._dirty = True
+            return
+        
+        self._schedule_update(self._event_handlers.get(type(event), self._refresh))
+    
+    def _schedule_update(self, handler):
+        """
+        Encola handler para el próximo ciclo idle. Varios cambios seguidos
+        (p. ej. un arrastre de volumen) se aplican en una sola pasada.
+        """
+        if self._pending_updates is None:
+            self._pending_updates = set()
+            self.after_idle(self._flush_updates)
+        self._pending_updates.add(handler)
+    
+    def _flush_updates(self):
+        handlers, self._pending_updates = self._pending_updates, None
+        
+        # La card pudo destruirse mientras esperaba
+        if not handlers or not self.winfo_exists():
+            return
+        
+        # Un refresco completo ya incluye los puntuales
+        if self._refresh in handlers:
+            self._refresh()
+            return
         
-        # Actualizar botón de loop
-        loop_color = self.main_window.SUCCESS if sound.loop else self.main_window.ACCENT_DIM
-        self.loop_btn.configure(border_color=loop_color, text_color=loop_color)
+        for handler in handlers:
+            handler()
+    
+    def _refresh(self):
+        """Vuelca self.sound en los widgets"""
+        self._dirty = False
         
-        # Actualizar hotkey
-        hotkey_text = sound.hotkey if sound.hotkey else "KEY"
-        self.hotkey_btn.configure(text=hotkey_text)
+        self._apply_name()
+        self._apply_loop()
+        self._apply_hotkey()
+        self._apply_volume()
+        self._apply_image()
+    
+    def _apply_name(self):
+        self._configure(self.name_label, text=self.sound.name.upper())
+    
+    def _apply_loop(self):
+        # Estado y botón de loop; los textos solo se arman si cambió el loop
+        loop = self.sound.loop
+        if not self._changed(self.loop_btn, "loop", loop):
+            return
         
-        # Actualizar volumen
-        self.volume_percent_label.configure(text=f"{int(sound.volume * 100)}%")
+        status_text = "LOOP" if loop else "READY"
+        self._configure(self.status_label, text=f"0:00 // {status_text}")
+        
+        loop_color = self.main_window.SUCCESS if loop else self.main_window.ACCENT_DIM
+        self._configure(self.loop_btn, border_color=loop_color, text_color=loop_color)
+    
+    def _apply_hotkey(self):
+        hotkey_text = self.sound.hotkey if self.sound.hotkey else "KEY"
+        self._configure(self.hotkey_btn, text=hotkey_text)
+    
+    def _apply_volume(self):
+        # Al arrastrar llegan muchos volúmenes con el mismo porcentaje entero
+        percent = int(self.sound.volume * 100)
+        if self._changed(self.volume_percent_label, "percent", percent):
+            self._configure(self.volume_percent_label, text=f"{percent}%")
         self._update_volume_visual()
+    
+    def _apply_image(self):
+        if self.sound.image_path:
+            self._load_image(self.sound.image_path)
+    
+    def _configure(self, widget, **options):
+        """
+        configure() solo con las opciones que cambiaron.
+        Cada configure cruza a Tcl y redibuja el canvas del widget.
+        """
+        changed = {
+            option: value for option, value in options.items()
+            if self._applied.get((widget, option)) != value
+        }
+        if not changed:
+            return
         
-        # Actualizar imagen
-        if sound.image_path:
-            self._load_image(sound.image_path)
\ No newline at end of file
+        widget.configure(**changed)
+        for option, value in changed.items():
+            self._applied[(widget, option)] = value
+    
+    def _changed(self, widget, key, value) -> bool:
+        """True (y lo recuerda) si value difiere del último visto para widget/key"""
+        if self._applied.get((widget, key)) == value:
+            return False
+        self._applied[(widget, key)] = value
+        return True